@@ -1,5 +1,11 @@
-GRAPHITI_MCP_URL = "http://localhost:8000/mcp"
-BASELINE_MODEL_NAME = "gpt-4o-mini"
+from memory_agents.core.config import BASELINE_MODEL_NAME, GRAPHITI_MCP_URL
+
+__all__ = [
+    "BASELINE_MODEL_NAME",
+    "GRAPHITI_MCP_URL",
+    "LONGMEMEVAL_URL_MAP",
+    "LONGMEMEVAL_DIFFICIULTY_LEVEL",
+]
 
 LONGMEMEVAL_URL_MAP = {
     "easy": "https://huggingface.co/datasets/xiaowu0162/longmemeval-cleaned/resolve/main/longmemeval_oracle.json",
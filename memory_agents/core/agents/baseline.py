@@ -16,9 +16,9 @@ Example:
 
 from typing import Any
 from langchain.agents import create_agent
-from langgraph.checkpoint.memory import InMemorySaver
-from memory_agents.config import BASELINE_MODEL_NAME
 from memory_agents.core.agents.interfaces.clearable_agent import ClearableAgent
+from memory_agents.core.config import BASELINE_MODEL_NAME, BASELINE_SYSTEM_PROMPT
+from memory_agents.core.utils.bounded_in_memory_saver import BoundedInMemorySaver
 
 
 class BaselineAgent(ClearableAgent):
@@ -45,8 +45,8 @@ class BaselineAgent(ClearableAgent):
         """
         agent: Any = create_agent(
             model=BASELINE_MODEL_NAME,
-            system_prompt="You are a memory agent that helps the user to solve tasks.",
-            checkpointer=InMemorySaver(),
+            system_prompt=BASELINE_SYSTEM_PROMPT,
+            checkpointer=BoundedInMemorySaver(),
         )
         self.agent: Any = agent
 
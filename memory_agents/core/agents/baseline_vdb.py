@@ -19,7 +19,6 @@ Example:
 
 from typing import Any, Dict, List
 from langchain.agents import create_agent
-from langgraph.checkpoint.memory import InMemorySaver
 
 from memory_agents.core.agents.interfaces.clearable_agent import ClearableAgent
 from memory_agents.core.chroma_db_manager import ChromaDBManager
@@ -27,6 +26,10 @@ from memory_agents.core.config import (
     BASELINE_CHROMADB_DIR,
     BASELINE_MEMORY_PROMPT,
     BASELINE_MODEL_NAME,
+    RESPONSE_CACHE_ENABLED,
+)
+from memory_agents.core.middleware.semantic_response_cache_middleware import (
+    SemanticResponseCacheMiddleware,
 )
 from memory_agents.core.middleware.vdb_augmentation_middleware import (
     VDBAugmentationMiddleware,
@@ -34,6 +37,8 @@ from memory_agents.core.middleware.vdb_augmentation_middleware import (
 from memory_agents.core.middleware.vdb_retrieval_middleware import (
     VDBRetrievalMiddleware,
 )
+from memory_agents.core.utils.bounded_in_memory_saver import BoundedInMemorySaver
+from memory_agents.core.utils.semantic_response_cache import SemanticResponseCache
 
 
 class BaselineVDBAgent(ClearableAgent):
@@ -47,6 +52,8 @@ class BaselineVDBAgent(ClearableAgent):
     Attributes:
         agent: The underlying LangChain agent instance with VDB middleware.
         chroma_manager: The ChromaDB manager for conversation storage.
+        response_cache: Semantic cache of the model responses, or None if
+            RESPONSE_CACHE_ENABLED is off.
 
     Example:
         >>> agent = BaselineVDBAgent("/path/to/db")
@@ -58,24 +65,32 @@ class BaselineVDBAgent(ClearableAgent):
     def __init__(self, persist_directory: str = BASELINE_CHROMADB_DIR) -> None:
         """Initialize the baseline VDB agent.
 
-        Creates a ChromaDB manager for persistent storage and sets up a LangChain
-        agent with vector database middleware for conversation augmentation
-        and retrieval.
+        Creates a ChromaDB manager for persistent storage, loads its embedding
+        model, and sets up a LangChain agent with vector database middleware
+        for conversation augmentation and retrieval. If RESPONSE_CACHE_ENABLED
+        is set, repeated queries are answered from a semantic response cache.
 
         Args:
             persist_directory: Directory path for ChromaDB persistence.
                 Defaults to BASELINE_CHROMADB_DIR from config.
         """
         self.chroma_manager = ChromaDBManager(persist_directory)
+        self.chroma_manager.warm_up()
+
+        middleware: List[Any] = [
+            VDBAugmentationMiddleware(self.chroma_manager),
+            VDBRetrievalMiddleware(self.chroma_manager),
+        ]
+        self.response_cache: SemanticResponseCache | None = None
+        if RESPONSE_CACHE_ENABLED:
+            self.response_cache = SemanticResponseCache(self.chroma_manager.embed_query)
+            middleware.insert(0, SemanticResponseCacheMiddleware(self.response_cache))
 
         agent: Any = create_agent(
             model=BASELINE_MODEL_NAME,
             system_prompt=BASELINE_MEMORY_PROMPT,
-            checkpointer=InMemorySaver(),
-            middleware=[
-                VDBAugmentationMiddleware(self.chroma_manager),
-                VDBRetrievalMiddleware(self.chroma_manager),
-            ],
+            checkpointer=BoundedInMemorySaver(),
+            middleware=middleware,
         )
         self.agent = agent
 
@@ -83,7 +98,9 @@ class BaselineVDBAgent(ClearableAgent):
         """Return ChromaDB statistics.
 
         Retrieves current statistics from the ChromaDB conversation collection,
-        providing insights into the amount of stored conversation data.
+        providing insights into the amount of stored conversation data. The count
+        is memoized by the ChromaDB manager, so polling this method does not
+        query ChromaDB.
 
         Returns:
             Dictionary containing database statistics:
@@ -96,7 +113,7 @@ class BaselineVDBAgent(ClearableAgent):
             return {}
 
         return {
-            "total_conversation_turns": self.chroma_manager.conversation_collection.count()
+            "total_conversation_turns": self.chroma_manager.count_conversation_turns()
         }
 
     def search_past_conversations(
@@ -129,6 +146,17 @@ class BaselineVDBAgent(ClearableAgent):
         Removes all conversation data from the ChromaDB collection,
         effectively resetting the agent's persistent memory state.
         This operation is irreversible and will delete all stored
-        conversation history.
+        conversation history. Cached responses are discarded as well.
         """
         self.chroma_manager.clear_collection()
+        if self.response_cache:
+            self.response_cache.clear()
+
+    def close(self) -> None:
+        """Store buffered conversation turns and release the ChromaDB manager.
+
+        Stops the manager's writer thread and removes its exit hook, so a
+        discarded agent can be garbage collected. The agent must not be used
+        afterwards.
+        """
+        self.chroma_manager.close()
@@ -17,19 +17,17 @@ Example:
 
 from typing import Self
 from langchain.agents import create_agent
-from langgraph.checkpoint.memory import InMemorySaver
 
 from memory_agents.core.agents.interfaces.clearable_agent import ClearableAgent
 from memory_agents.core.agents.graphiti_base_agent import GraphitiBaseAgent
-from memory_agents.config import BASELINE_MODEL_NAME
-
-from memory_agents.core.config import BASELINE_MEMORY_PROMPT
+from memory_agents.core.config import BASELINE_MEMORY_PROMPT, BASELINE_MODEL_NAME
 from memory_agents.core.middleware.graphiti_augmentation_middleware import (
     GraphitiAugmentationMiddleware,
 )
 from memory_agents.core.middleware.graphiti_retrieval_middleware import (
     GraphitiRetrievalMiddleware,
 )
+from memory_agents.core.utils.bounded_in_memory_saver import BoundedInMemorySaver
 
 
 class GraphitiAgent(GraphitiBaseAgent, ClearableAgent):
@@ -42,6 +40,9 @@ class GraphitiAgent(GraphitiBaseAgent, ClearableAgent):
 
     Attributes:
         agent: The underlying LangChain agent instance with Graphiti middleware.
+        augmentation_middleware: The middleware storing conversation turns in
+            Graphiti.
+        retrieval_middleware: The middleware retrieving memories from Graphiti.
 
     Example:
         >>> agent = await GraphitiAgent.create()
@@ -57,6 +58,8 @@ class GraphitiAgent(GraphitiBaseAgent, ClearableAgent):
         to allow for async operations during initialization.
         """
         self.agent = None
+        self.augmentation_middleware: GraphitiAugmentationMiddleware | None = None
+        self.retrieval_middleware: GraphitiRetrievalMiddleware | None = None
 
     @classmethod
     async def create(cls) -> Self:
@@ -75,13 +78,17 @@ class GraphitiAgent(GraphitiBaseAgent, ClearableAgent):
         """
         self = cls()
         graphiti_tools_all = await self._get_graphiti_mcp_tools(is_read_only=False)
+        self.augmentation_middleware = GraphitiAugmentationMiddleware(
+            graphiti_tools_all
+        )
+        self.retrieval_middleware = GraphitiRetrievalMiddleware(graphiti_tools_all)
         self.agent = create_agent(
             model=BASELINE_MODEL_NAME,
             system_prompt=BASELINE_MEMORY_PROMPT,
-            checkpointer=InMemorySaver(),
+            checkpointer=BoundedInMemorySaver(),
             middleware=[
-                GraphitiAugmentationMiddleware(graphiti_tools_all),
-                GraphitiRetrievalMiddleware(graphiti_tools_all),
+                self.augmentation_middleware,
+                self.retrieval_middleware,
             ],
         )
         return self
@@ -92,9 +99,23 @@ class GraphitiAgent(GraphitiBaseAgent, ClearableAgent):
         Removes all entities, relationships, and episodes from the knowledge
         graph, effectively resetting the agent's structured memory state.
         This operation is irreversible and will delete all stored knowledge.
+        Buffered episodes and memoized search results are discarded as well.
 
         Note:
             This method calls the inherited clear_graph() method from
             GraphitiBaseAgent to perform the actual clearing operation.
         """
+        if self.augmentation_middleware:
+            self.augmentation_middleware.clear_pending_episodes()
         await self.clear_graph()
+        if self.retrieval_middleware:
+            self.retrieval_middleware.clear_search_cache()
+
+    def close(self) -> None:
+        """Write buffered episodes to Graphiti and release the middleware.
+
+        Removes the middleware's exit hook, so a discarded agent can be
+        garbage collected. The agent must not be used afterwards.
+        """
+        if self.augmentation_middleware:
+            self.augmentation_middleware.close()
@@ -17,9 +17,9 @@ Example:
 
 """
 
+import asyncio
 from typing import Any, Self, List, Dict
 from langchain.agents import create_agent
-from langgraph.checkpoint.memory import InMemorySaver
 
 from memory_agents.core.agents.interfaces.clearable_agent import ClearableAgent
 from memory_agents.core.agents.graphiti_base_agent import GraphitiBaseAgent
@@ -28,16 +28,16 @@ from memory_agents.core.config import (
     BASELINE_MEMORY_PROMPT,
     BASELINE_MODEL_NAME,
     GRAPHITI_VDB_CHROMADB_DIR,
+    RESPONSE_CACHE_ENABLED,
 )
-from memory_agents.core.middleware.graphiti_augmentation_middleware import (
-    GraphitiAugmentationMiddleware,
+from memory_agents.core.middleware.graphiti_vdb_middleware import (
+    GraphitiVDBMiddleware,
 )
-from memory_agents.core.middleware.graphiti_vdb_retrieval_middleware import (
-    GraphitiVDBRetrievalMiddleware,
-)
-from memory_agents.core.middleware.vdb_augmentation_middleware import (
-    VDBAugmentationMiddleware,
+from memory_agents.core.middleware.semantic_response_cache_middleware import (
+    SemanticResponseCacheMiddleware,
 )
+from memory_agents.core.utils.bounded_in_memory_saver import BoundedInMemorySaver
+from memory_agents.core.utils.semantic_response_cache import SemanticResponseCache
 
 
 class GraphitiVDBAgent(GraphitiBaseAgent, ClearableAgent):
@@ -45,12 +45,17 @@ class GraphitiVDBAgent(GraphitiBaseAgent, ClearableAgent):
 
     This agent combines the structured knowledge representation of Graphiti
     with the semantic search capabilities of ChromaDB to provide comprehensive
-    memory functionality. It uses multiple middleware components for optimal
-    information storage and retrieval.
+    memory functionality. A single fused middleware retrieves memories from both
+    sources before the model runs and stores each conversation turn in both
+    afterwards.
 
     Attributes:
         agent: The underlying LangChain agent instance with hybrid middleware.
         chroma_manager: The ChromaDB manager for conversation storage.
+        memory_middleware: The fused middleware retrieving and storing
+            memories in Graphiti and ChromaDB.
+        response_cache: Semantic cache of the model responses, or None if
+            RESPONSE_CACHE_ENABLED is off.
 
     Example:
         >>> agent = await GraphitiVDBAgent.create("/path/to/db")
@@ -68,15 +73,18 @@ class GraphitiVDBAgent(GraphitiBaseAgent, ClearableAgent):
         """
         self.agent: Any = None
         self.chroma_manager: ChromaDBManager = None
+        self.memory_middleware: GraphitiVDBMiddleware | None = None
+        self.response_cache: SemanticResponseCache | None = None
 
     @classmethod
     async def create(cls, persist_directory: str = GRAPHITI_VDB_CHROMADB_DIR) -> Self:
         """Create and initialize a hybrid agent instance.
 
         This class method handles the async initialization process, including
-        setting up ChromaDB, retrieving Graphiti MCP tools, and configuring
-        the LangChain agent with multiple middleware components for hybrid
-        memory operations.
+        setting up ChromaDB while the Graphiti MCP tools are retrieved, and
+        configuring the LangChain agent with the fused Graphiti and VDB
+        middleware for hybrid memory operations. If RESPONSE_CACHE_ENABLED is
+        set, repeated queries are answered from a semantic response cache.
 
         Args:
             persist_directory: Directory path for ChromaDB persistence.
@@ -91,26 +99,49 @@ class GraphitiVDBAgent(GraphitiBaseAgent, ClearableAgent):
         """
         self = cls()
 
-        self.chroma_manager = ChromaDBManager(persist_directory)
+        # Opening ChromaDB and loading the embedding model are blocking and
+        # independent of the MCP handshake, so both run concurrently.
+        self.chroma_manager, graphiti_tools_all = await asyncio.gather(
+            asyncio.to_thread(self._create_chroma_manager, persist_directory),
+            self._get_graphiti_mcp_tools(is_read_only=False),
+        )
+        self.memory_middleware = GraphitiVDBMiddleware(
+            graphiti_tools_all, self.chroma_manager
+        )
+        middleware: List[Any] = [self.memory_middleware]
+        if RESPONSE_CACHE_ENABLED:
+            self.response_cache = SemanticResponseCache(self.chroma_manager.embed_query)
+            middleware.insert(0, SemanticResponseCacheMiddleware(self.response_cache))
 
-        graphiti_tools_all = await self._get_graphiti_mcp_tools(is_read_only=False)
         self.agent = create_agent(
             model=BASELINE_MODEL_NAME,
             system_prompt=BASELINE_MEMORY_PROMPT,
-            checkpointer=InMemorySaver(),
-            middleware=[
-                GraphitiVDBRetrievalMiddleware(graphiti_tools_all, self.chroma_manager),
-                GraphitiAugmentationMiddleware(graphiti_tools_all),
-                VDBAugmentationMiddleware(self.chroma_manager),
-            ],
+            checkpointer=BoundedInMemorySaver(),
+            middleware=middleware,
         )
         return self
 
+    @staticmethod
+    def _create_chroma_manager(persist_directory: str) -> ChromaDBManager:
+        """Open ChromaDB and load the embedding model.
+
+        Args:
+            persist_directory: Directory path for ChromaDB persistence.
+
+        Returns:
+            A ChromaDB manager whose embedding model is loaded.
+        """
+        chroma_manager = ChromaDBManager(persist_directory)
+        chroma_manager.warm_up()
+        return chroma_manager
+
     def get_chromadb_stats(self) -> Dict[str, int]:
         """Return ChromaDB statistics.
 
         Retrieves current statistics from the ChromaDB conversation collection,
-        providing insights into the amount of stored conversation data.
+        providing insights into the amount of stored conversation data. The count
+        is memoized by the ChromaDB manager, so polling this method does not
+        query ChromaDB.
 
         Returns:
             Dictionary containing database statistics:
@@ -123,7 +154,7 @@ class GraphitiVDBAgent(GraphitiBaseAgent, ClearableAgent):
             return {}
 
         return {
-            "total_conversation_turns": self.chroma_manager.conversation_collection.count()
+            "total_conversation_turns": self.chroma_manager.count_conversation_turns()
         }
 
     def search_past_conversations(
@@ -156,11 +187,31 @@ class GraphitiVDBAgent(GraphitiBaseAgent, ClearableAgent):
         Removes all conversation data from the ChromaDB collection and all
         entities, relationships, and episodes from the knowledge graph,
         effectively resetting the agent's complete memory state. This operation
-        is irreversible and will delete all stored memory.
+        is irreversible and will delete all stored memory. Cached responses,
+        buffered Graphiti episodes and memoized Graphiti searches are
+        discarded as well.
 
         Note:
             This method clears both the vector database (via chroma_manager)
             and the knowledge graph (via inherited clear_graph() method).
         """
         self.chroma_manager.clear_collection()
+        if self.response_cache:
+            self.response_cache.clear()
+        if self.memory_middleware:
+            self.memory_middleware.clear_pending_episodes()
         await self.clear_graph()
+        if self.memory_middleware:
+            self.memory_middleware.clear_search_cache()
+
+    def close(self) -> None:
+        """Store buffered conversation turns and release the memory resources.
+
+        Writes buffered episodes to Graphiti, stops the ChromaDB manager's
+        writer thread and removes the exit hooks of both, so a discarded
+        agent can be garbage collected. The agent must not be used afterwards.
+        """
+        if self.memory_middleware:
+            self.memory_middleware.close()
+        if self.chroma_manager:
+            self.chroma_manager.close()
@@ -6,11 +6,165 @@ for retrieval-augmented generation (RAG) applications.
 
 """
 
-from typing import Any, Dict, List
-from chromadb import Client, QueryResult
+import atexit
+import functools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, NamedTuple
+
+import numpy as np
+from chromadb import ClientAPI, Collection, PersistentClient, QueryResult
 from chromadb.config import Settings
+from chromadb.errors import NotFoundError
 from datetime import datetime
 
+from memory_agents.core.config import (
+    CHROMADB_BATCH_SIZE,
+    CHROMADB_COLLECTION_METADATA,
+    CHROMADB_LOAD_PAGE_SIZE,
+    CHROMADB_SEARCH_CACHE_SIZE,
+    CHROMADB_SQLITE_WAL,
+    EMBEDDING_MAX_CHARS,
+    QUERY_EMBEDDING_CACHE_SIZE,
+)
+from memory_agents.core.utils.in_memory_vector_index import (
+    InMemoryVectorIndex,
+    MetadataFilter,
+    validate_metadata_filter,
+)
+from memory_agents.core.utils.minilm_embedding_function import MiniLMEmbeddingFunction
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(persist_directory: str) -> ClientAPI:
+    """Return the ChromaDB client for a persist directory, creating it once.
+
+    Agents sharing a persist directory in one process reuse the same client
+    instead of each validating the tenant and database on creation. The
+    client alone does not keep their in-memory state consistent, so the
+    collection, vector index and turn counter are shared through
+    _get_shared_state. If CHROMADB_SQLITE_WAL is set, the SQLite store is
+    switched to write-ahead logging once the client has created it.
+
+    Args:
+        persist_directory: Directory path for persistent ChromaDB storage.
+
+    Returns:
+        The persistent ChromaDB client for the directory.
+    """
+    client = PersistentClient(
+        path=persist_directory, settings=Settings(anonymized_telemetry=False)
+    )
+    if CHROMADB_SQLITE_WAL:
+        _enable_sqlite_wal(persist_directory)
+    return client
+
+
+class _SharedConversationState:
+    """Conversation state shared by all managers of a persist directory.
+
+    Managers of the same directory store their turns in the same collection,
+    so they must also share its in-memory copy and the turn counter that
+    allocates the turn IDs. Otherwise each manager would number its turns
+    from its own count and miss the turns stored by the others.
+
+    Attributes:
+        lock: Lock guarding the shared state and the pending turns of all
+            managers of the directory.
+        collection: The ChromaDB collection storing the conversations, or
+            None until the first manager of the directory opened it.
+        vector_index: In-memory copy of the stored conversation embeddings.
+        message_counter: Number of turn IDs allocated so far.
+        generation: Number of times the collection was cleared. Turns
+            buffered before a clear are discarded instead of inserted.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty state whose collection is not opened yet."""
+        self.lock = threading.RLock()
+        self.collection: Collection | None = None
+        self.vector_index = InMemoryVectorIndex()
+        self.message_counter = 0
+        self.generation = 0
+
+
+@functools.lru_cache(maxsize=None)
+def _get_shared_state(persist_directory: str) -> _SharedConversationState:
+    """Return the conversation state of a persist directory, creating it once.
+
+    Like the client, the state is cached per directory, so all managers of a
+    directory in one process share one vector index and turn counter.
+
+    Args:
+        persist_directory: Directory path for persistent ChromaDB storage.
+
+    Returns:
+        The conversation state shared by the managers of the directory.
+    """
+    return _SharedConversationState()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_embedding_function() -> MiniLMEmbeddingFunction:
+    """Return the embedding function shared by all managers of the process.
+
+    The ONNX model and tokenizer are loaded by the first embedding, so
+    sharing one instance keeps a single copy of the model in memory and
+    loads it once, however many agents are created.
+
+    Returns:
+        The process-wide all-MiniLM-L6-v2 embedding function.
+    """
+    return MiniLMEmbeddingFunction()
+
+
+def _enable_sqlite_wal(persist_directory: str) -> None:
+    """Switch ChromaDB's SQLite store to write-ahead logging.
+
+    ChromaDB's connections are managed by its Rust bindings and cannot be
+    configured from Python, but the journal mode is persisted in the database
+    file, so setting it once applies to all of them. Failures are logged and
+    the store keeps its journal mode.
+
+    Args:
+        persist_directory: Directory path for persistent ChromaDB storage.
+    """
+    connection = sqlite3.connect(os.path.join(persist_directory, "chroma.sqlite3"))
+    try:
+        (journal_mode,) = connection.execute("PRAGMA journal_mode=WAL").fetchone()
+        if journal_mode != "wal":
+            logging.getLogger().warning(
+                "ChromaDB's SQLite store stays in %s journal mode", journal_mode
+            )
+    except sqlite3.Error:
+        logging.getLogger().exception("Enabling WAL for ChromaDB's SQLite store failed")
+    finally:
+        connection.close()
+
+
+class SearchHits(NamedTuple):
+    """Conversation search results stored as parallel lists.
+
+    Attributes:
+        ids: Document IDs of the hits.
+        contents: Conversation texts of the hits.
+        metadatas: Metadata dictionaries of the hits.
+        distances: Cosine distances of the hits to the query.
+        embeddings: Embeddings of the hits as rows of a matrix, scaled to
+            a common norm, or None if they were not returned.
+    """
+
+    ids: List[str]
+    contents: List[str]
+    metadatas: List[Dict[str, Any]]
+    distances: List[float | None]
+    embeddings: np.ndarray | None = None
+
 
 class ChromaDBManager:
     """Manages ChromaDB integration for conversational RAG.
@@ -20,141 +174,493 @@ class ChromaDBManager:
     It handles collection management, document storage, and similarity search.
 
     Attributes:
-        client: The ChromaDB client instance.
+        client: The ChromaDB client instance, shared by all managers of the
+            same persist directory.
+        embedding_function: The all-MiniLM-L6-v2 ONNX embedding function used
+            to embed stored conversations and search queries, padding each
+            batch only to its longest text. It is shared by all managers.
         conversation_collection: The ChromaDB collection for storing conversations.
-        message_counter: Counter for tracking the number of stored messages.
+        vector_index: In-memory copy of the stored conversation embeddings,
+            used to answer similarity searches without querying ChromaDB. It
+            is shared by all managers of the same persist directory.
+        message_counter: Counter for tracking the number of stored messages,
+            shared by all managers of the same persist directory.
+        batch_size: Number of conversation turns buffered before they are
+            inserted into the collection in a single call.
+        search_cache_hits: Number of searches answered from the search cache.
+        search_cache_misses: Number of searches that queried the vector index.
 
     Args:
         persist_directory: Directory path for persistent ChromaDB storage.
+        batch_size: Number of conversation turns buffered per insert.
     """
 
-    def __init__(self, persist_directory: str):
+    def __init__(self, persist_directory: str, batch_size: int = CHROMADB_BATCH_SIZE):
         """Initialize the ChromaDB manager with persistent storage.
 
         Args:
             persist_directory: Directory path for persistent ChromaDB storage.
+            batch_size: Number of conversation turns buffered before they are
+                inserted into the collection. Defaults to CHROMADB_BATCH_SIZE
+                from config.
         """
-        self.client = Client(
-            Settings(
-                anonymized_telemetry=False,
-                is_persistent=True,
-                persist_directory=persist_directory,
-            )
-        )
-
-        self._get_or_create_conversation_collection()
-
-        self.message_counter = self.conversation_collection.count()
+        self.client = _get_client(persist_directory)
+
+        # Chroma's default embedding function wraps the same all-MiniLM-L6-v2
+        # model, but builds a fresh ONNX session on every call. Holding one
+        # shared instance keeps the model loaded, and passing the vectors
+        # explicitly keeps existing collections (persisted with the default
+        # function) valid.
+        self.embedding_function = _get_embedding_function()
+
+        self._shared = _get_shared_state(persist_directory)
+        self.vector_index = self._shared.vector_index
+        # The pending turns of all managers of the directory are guarded by
+        # the shared lock, so turn IDs are allocated and inserted atomically.
+        self._pending_lock = self._shared.lock
+        with self._pending_lock:
+            if self._shared.collection is None:
+                self._get_or_create_conversation_collection()
+                self._load_vector_index()
+                # The index mirrors the collection, so its size is the stored
+                # turn count without a second COUNT query.
+                self._shared.message_counter = len(self.vector_index)
+
+        self.batch_size = batch_size
+        self._pending_documents: List[str] = []
+        self._pending_metadatas: List[Dict[str, Any]] = []
+        self._pending_ids: List[str] = []
+        self._pending_timestamps: List[float] = []
+        self._pending_generation = self._shared.generation
+        self._search_cache: OrderedDict[tuple, SearchHits] = OrderedDict()
+        # Other managers of the directory insert into the shared index, so
+        # the cache is only valid for the index state it was filled for.
+        self._search_cache_state = (self._shared.generation, len(self.vector_index))
+        self.search_cache_hits = 0
+        self.search_cache_misses = 0
+        self._query_embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._query_embedding_lock = threading.Lock()
+        # A single writer keeps background inserts in submission order.
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._last_background_write: Future | None = None
+        # Buffered turns would otherwise be lost when the process exits.
+        atexit.register(self.flush)
+
+    @property
+    def conversation_collection(self) -> Collection:
+        """The collection shared by all managers of the persist directory."""
+        return self._shared.collection
+
+    @property
+    def message_counter(self) -> int:
+        """The number of turn IDs allocated in the persist directory."""
+        return self._shared.message_counter
 
     def _get_or_create_conversation_collection(self):
         """Get or create the conversation collection.
 
         Creates a single collection for all conversations using cosine
-        similarity for HNSW indexing. This method is called during initialization.
+        similarity and the HNSW settings from CHROMADB_COLLECTION_METADATA.
+        This method is called during initialization.
         """
         # Single collection for all conversations
-        self.conversation_collection = self.client.get_or_create_collection(
-            name="baseline_conversations", metadata={"hnsw:space": "cosine"}
+        self._shared.collection = self.client.get_or_create_collection(
+            name="baseline_conversations", metadata=CHROMADB_COLLECTION_METADATA
         )
 
+    def _load_vector_index(self):
+        """Load all persisted conversation embeddings into the vector index.
+
+        ChromaDB remains the persistent store, so the in-memory index is
+        rebuilt from the collection whenever the manager is created. The
+        collection is read in pages of CHROMADB_LOAD_PAGE_SIZE turns, and each
+        page is quantized before the next one is read. Loading stops at the
+        first partial page, so the collection is never counted separately.
+        """
+        offset = 0
+        while True:
+            stored = self.conversation_collection.get(
+                include=["documents", "embeddings", "metadatas"],
+                limit=CHROMADB_LOAD_PAGE_SIZE,
+                offset=offset,
+            )
+            if stored["ids"]:
+                self.vector_index.add(
+                    ids=stored["ids"],
+                    documents=stored["documents"],
+                    embeddings=stored["embeddings"],
+                    metadatas=stored["metadatas"],
+                )
+            if len(stored["ids"]) < CHROMADB_LOAD_PAGE_SIZE:
+                break
+            offset += CHROMADB_LOAD_PAGE_SIZE
+
     def add_conversation_turn(
         self, user_message: str, ai_message: str, metadata: Dict[str, Any] | None = None
     ) -> None:
         """Add a complete conversation turn to ChromaDB.
 
         Stores both user and assistant messages as a single document with
-        associated metadata for retrieval and context.
+        associated metadata for retrieval and context. The turn is buffered
+        and inserted once batch_size turns are pending.
 
         Args:
             user_message: The user's message in the conversation turn.
             ai_message: The assistant's response in the conversation turn.
             metadata: Optional additional metadata to store with the conversation.
         """
-        self.message_counter += 1
-        timestamp = datetime.now().isoformat()
-
-        if metadata is None:
-            metadata = {}
-
         # Combine both messages for complete context
         conversation_text = f"User: {user_message}\n\nAssistant: {ai_message}"
 
-        metadata.update(
-            {
-                "user_message": user_message,
-                "ai_message": ai_message,
-                "timestamp": timestamp,
-                "turn_id": self.message_counter,
-            }
+        with self._pending_lock:
+            self._discard_stale_pending()
+            self._shared.message_counter += 1
+            turn_id = self._shared.message_counter
+
+            self._pending_documents.append(conversation_text)
+            # Built in one display, which neither mutates the caller's dict nor
+            # allocates an intermediate one.
+            self._pending_metadatas.append(
+                {
+                    **(metadata or {}),
+                    "user_message": user_message,
+                    "ai_message": ai_message,
+                    "turn_id": turn_id,
+                }
+            )
+            self._pending_ids.append(f"turn_{turn_id}")
+            # Formatting is deferred to the insert, the turn keeps its own time.
+            self._pending_timestamps.append(time.time())
+
+            if len(self._pending_ids) >= self.batch_size:
+                self._insert_pending()
+
+    def add_conversation_turn_in_background(
+        self, user_message: str, ai_message: str, metadata: Dict[str, Any] | None = None
+    ) -> Future:
+        """Add a conversation turn to ChromaDB without waiting for the insert.
+
+        The turn is handed to a single writer thread, so embedding and
+        inserting it does not delay the caller. Turns are stored in the order
+        they were submitted, and searches wait for all submitted turns, so a
+        turn can be retrieved as soon as this method returns.
+
+        Args:
+            user_message: The user's message in the conversation turn.
+            ai_message: The assistant's response in the conversation turn.
+            metadata: Optional additional metadata to store with the conversation.
+
+        Returns:
+            A future that resolves once the turn was added.
+        """
+        future = self._writer.submit(
+            self.add_conversation_turn, user_message, ai_message, metadata
         )
+        future.add_done_callback(self._log_background_write_error)
+        self._last_background_write = future
+        return future
+
+    @staticmethod
+    def _log_background_write_error(future: Future) -> None:
+        """Log the error of a failed background insert.
+
+        Args:
+            future: The future of the background insert.
+        """
+        if future.exception() is not None:
+            logging.getLogger().error(
+                "Storing a conversation turn in ChromaDB failed",
+                exc_info=future.exception(),
+            )
+
+    def _wait_for_background_writes(self) -> None:
+        """Wait until all turns submitted for a background insert were added."""
+        last_background_write = self._last_background_write
+        if last_background_write is not None:
+            wait([last_background_write])
+
+    def flush(self) -> None:
+        """Insert all buffered conversation turns into the collection.
+
+        Waits for the turns submitted with add_conversation_turn_in_background
+        first, then inserts the buffered turns. Does nothing if no turns are
+        pending.
+        """
+        self._wait_for_background_writes()
+        with self._pending_lock:
+            self._insert_pending()
+
+    def close(self) -> None:
+        """Insert all buffered conversation turns and stop the writer thread.
 
+        The manager must not store further turns afterwards. Buffered turns
+        are also flushed when the process exits, but the exit hook keeps the
+        manager alive until then, so managers that are discarded before the
+        process exits should be closed.
+        """
+        self.flush()
+        self._writer.shutdown()
+        atexit.unregister(self.flush)
+
+    def _insert_pending(self) -> None:
+        """Insert the buffered conversation turns into the collection.
+
+        The pending turns are embedded with one call to the embedding model
+        and written with a single add call, which is far cheaper than one
+        forward pass and one transaction per turn. Each turn is timestamped
+        with the time it was added, formatted only now. Must be called while
+        holding the pending lock.
+        """
+        self._discard_stale_pending()
+        if not self._pending_ids:
+            return
+
+        for metadata, timestamp in zip(
+            self._pending_metadatas, self._pending_timestamps
+        ):
+            metadata["timestamp"] = datetime.fromtimestamp(timestamp).isoformat()
+
+        embeddings = self.embedding_function(
+            [document[:EMBEDDING_MAX_CHARS] for document in self._pending_documents]
+        )
         self.conversation_collection.add(
-            documents=[conversation_text],
-            metadatas=[metadata],
-            ids=[f"turn_{self.message_counter}"],
+            documents=self._pending_documents,
+            embeddings=embeddings,
+            metadatas=self._pending_metadatas,
+            ids=self._pending_ids,
+        )
+        self.vector_index.add(
+            ids=self._pending_ids,
+            documents=self._pending_documents,
+            embeddings=embeddings,
+            metadatas=self._pending_metadatas,
         )
+        self._clear_pending()
+
+    def _clear_pending(self) -> None:
+        """Discard all buffered conversation turns."""
+        self._pending_documents = []
+        self._pending_metadatas = []
+        self._pending_ids = []
+        self._pending_timestamps = []
+
+    def _discard_stale_pending(self) -> None:
+        """Discard the buffered turns if the collection was cleared since.
+
+        Any manager of the persist directory may clear the shared collection,
+        and the turns buffered before belong to the discarded history. Must be
+        called while holding the pending lock.
+        """
+        if self._pending_generation != self._shared.generation:
+            self._clear_pending()
+            self._pending_generation = self._shared.generation
+
+    def count_conversation_turns(self) -> int:
+        """Return the number of conversation turns stored in the collection.
+
+        The count is read from the in-memory vector index, which mirrors the
+        collection, so no COUNT query is sent to ChromaDB. Turns submitted for
+        a background insert are waited for, buffered turns that were not
+        flushed yet are not included.
+
+        Returns:
+            The number of stored conversation turns.
+        """
+        self._wait_for_background_writes()
+        return len(self.vector_index)
 
     def search_conversations(
-        self, query: str, n_results: int = 5
+        self, query: str, n_results: int = 5, where: MetadataFilter | None = None
     ) -> List[Dict[str, Any]]:
         """Search conversation history using semantic similarity.
 
-        Performs a similarity search against stored conversation turns
-        to find relevant context for the given query.
+        Performs a brute-force similarity search against the in-memory copy of
+        the stored conversation turns to find relevant context for the
+        given query.
 
         Args:
             query: The search query to find relevant conversations.
             n_results: Maximum number of results to return. Defaults to 5.
+            where: Optional metadata filter, e.g. {"thread_id": "1"}, that
+                restricts the search to matching conversation turns. Only
+                equality conditions are supported. Defaults to searching all
+                turns.
 
         Returns:
             List of dictionaries containing search results with content,
             metadata, distance scores, and document IDs.
+
+        Raises:
+            ValueError: If the filter contains operators or non-scalar values.
         """
-        total_count = self.conversation_collection.count()
-        if total_count == 0:
-            return []
+        hits = self.search_conversation_hits(query, n_results, where)
+        return [
+            {"content": content, "metadata": metadata, "distance": distance, "id": id}
+            for content, metadata, distance, id in zip(
+                hits.contents, hits.metadatas, hits.distances, hits.ids
+            )
+        ]
 
-        results = self.conversation_collection.query(
-            query_texts=[query], n_results=min(n_results, total_count)
-        )
+    def search_conversation_hits(
+        self, query: str, n_results: int = 5, where: MetadataFilter | None = None
+    ) -> SearchHits:
+        """Search conversation history and return the hits as parallel lists.
+
+        Same search as search_conversations, without building a dictionary
+        per result. Results are memoized until new turns are stored by any
+        manager of the persist directory, so middlewares repeating a search within a turn hit the cache. The index
+        is searched and the cache is updated while holding the pending lock,
+        so a concurrent background insert can neither interleave with the
+        search nor leave a stale result in the cache.
+
+        Args:
+            query: The search query to find relevant conversations.
+            n_results: Maximum number of results to return. Defaults to 5.
+            where: Optional metadata filter that restricts the search to
+                matching conversation turns. Only equality conditions are
+                supported. Defaults to searching all turns.
+
+        Returns:
+            The search hits, ordered by ascending distance.
+
+        Raises:
+            ValueError: If the filter contains operators or non-scalar values.
+        """
+        validate_metadata_filter(where)
+        self.flush()
+
+        cache_key = (query, n_results, tuple(sorted((where or {}).items())))
+        with self._pending_lock:
+            if len(self.vector_index) == 0:
+                return SearchHits([], [], [], [])
+            self._invalidate_stale_search_cache()
+            if cache_key in self._search_cache:
+                self.search_cache_hits += 1
+                self._search_cache.move_to_end(cache_key)
+                return self._search_cache[cache_key]
+            self.search_cache_misses += 1
+
+        # Embedding is the slow part of a miss and does not touch shared
+        # state, so inserts are not blocked while the query is embedded.
+        query_embedding = self.embed_query(query)
+
+        with self._pending_lock:
+            hits = self._format_results(
+                self.vector_index.search(query_embedding, n_results, where)
+            )
+            self._invalidate_stale_search_cache()
+            self._search_cache[cache_key] = hits
+            if len(self._search_cache) > CHROMADB_SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return hits
+
+    def _invalidate_stale_search_cache(self) -> None:
+        """Clear the search cache if turns were stored or cleared since.
+
+        The vector index is shared by all managers of the persist directory,
+        so turns stored by another manager must invalidate this manager's
+        cache as well. The index only grows between clears, so the clear
+        generation and its size identify its contents. Must be called while
+        holding the pending lock.
+        """
+        index_state = (self._shared.generation, len(self.vector_index))
+        if index_state != self._search_cache_state:
+            self._search_cache.clear()
+            self._search_cache_state = index_state
 
-        return self._format_results(results)
+    def warm_up(self) -> None:
+        """Load the embedding model ahead of the first conversation turn.
 
-    def _format_results(self, results: QueryResult) -> List[Dict[str, Any]]:
+        The ONNX model and tokenizer are loaded lazily on the first embedding,
+        which would otherwise delay the first search or insert. Failures are
+        logged and surface again on first use.
+        """
+        try:
+            self.embedding_function(["warm up"])
+        except Exception:
+            logging.getLogger().exception("Warming up the embedding model failed")
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Embed a search query, reusing the embedding of a repeated query.
+
+        Embeddings are kept in an LRU cache of QUERY_EMBEDDING_CACHE_SIZE
+        queries, which is not cleared when new turns are stored. The cache is
+        shared by retrieval workers and the response cache, so it is only
+        accessed while holding its lock. The model runs outside the lock.
+
+        Args:
+            query: The search query to embed.
+
+        Returns:
+            The embedding of the query.
+        """
+        with self._query_embedding_lock:
+            embedding = self._query_embedding_cache.get(query)
+            if embedding is not None:
+                self._query_embedding_cache.move_to_end(query)
+                return embedding
+
+        embedding = np.asarray(self.embedding_function([query])[0])
+
+        with self._query_embedding_lock:
+            self._query_embedding_cache[query] = embedding
+            if len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embedding_cache.popitem(last=False)
+        return embedding
+
+    def _format_results(self, results: QueryResult) -> SearchHits:
         """Format ChromaDB search results into a standardized structure.
 
-        Converts the raw ChromaDB query result into a list of dictionaries
-        with consistent structure for easier consumption.
+        ChromaDB already returns one list per field, so the lists of the
+        single query are taken over as they are.
 
         Args:
             results: The raw QueryResult from ChromaDB.
 
         Returns:
-            List of dictionaries containing formatted search results with
-            content, metadata, distance scores, and document IDs.
-        """
-        documents = []
-        if results["documents"] and results["documents"][0]:
-            for i, doc in enumerate(results["documents"][0]):
-                documents.append(
-                    {
-                        "content": doc,
-                        "metadata": results["metadatas"][0][i]
-                        if results["metadatas"]
-                        else {},
-                        "distance": results["distances"][0][i]
-                        if results["distances"]
-                        else None,
-                        "id": results["ids"][0][i] if results["ids"] else None,
-                    }
-                )
-        return documents
+            The search hits with contents, metadata, distance scores,
+            document IDs and, if included, embeddings.
+        """
+        if not results["documents"] or not results["documents"][0]:
+            return SearchHits([], [], [], [])
+
+        contents = results["documents"][0]
+        return SearchHits(
+            ids=results["ids"][0],
+            contents=contents,
+            metadatas=results["metadatas"][0]
+            if results["metadatas"]
+            else [{} for _ in contents],
+            distances=results["distances"][0]
+            if results["distances"]
+            else [None for _ in contents],
+            embeddings=np.asarray(results["embeddings"][0])
+            if results["embeddings"] is not None
+            else None,
+        )
 
     def clear_collection(self):
         """Clear all conversation data from the collection.
 
         Deletes the existing conversation collection and creates a new
         empty one, effectively removing all stored conversation history.
+        Dropping the collection removes its files at once instead of deleting
+        the stored turns one by one. Buffered turns that were not inserted yet
+        are discarded as well, including those of other managers of the same
+        persist directory, and turn IDs start from 1 again.
         """
-        self.client.delete_collection("baseline_conversations")
-        self._get_or_create_conversation_collection()
+        self._wait_for_background_writes()
+
+        with self._pending_lock:
+            self._clear_pending()
+            self._search_cache.clear()
+            self.vector_index.clear()
+            self._shared.message_counter = 0
+            self._shared.generation += 1
+            self._pending_generation = self._shared.generation
+            try:
+                self.client.delete_collection("baseline_conversations")
+            except NotFoundError:
+                # A process sharing the persist directory already dropped it.
+                pass
+            self._get_or_create_conversation_collection()
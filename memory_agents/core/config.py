@@ -8,9 +8,32 @@ Attributes:
     BASELINE_MODEL_NAME (str): Default model name for baseline operations.
     GRAPHITI_VDB_CHROMADB_DIR (str): Directory path for Graphiti vector database.
     BASELINE_CHROMADB_DIR (str): Directory path for baseline ChromaDB storage.
+    MMR_FETCH_K (int): Number of VDB results considered for maximal marginal relevance.
+    MMR_TOP_K (int): Number of VDB results selected by maximal marginal relevance.
+    MMR_LAMBDA (float): Trade-off between relevance and diversity of selected VDB results.
+    MIN_RELEVANCE_SCORE (float): Minimum query similarity of a VDB result considered for MMR.
+    CHECKPOINTER_MAX_THREADS (int): Maximum threads kept by the in-memory checkpointer.
+    CHROMADB_BATCH_SIZE (int): Number of conversation turns buffered per ChromaDB insert.
+    CHROMADB_SEARCH_CACHE_SIZE (int): Number of conversation searches kept in memory.
+    QUERY_EMBEDDING_CACHE_SIZE (int): Number of query embeddings kept in memory.
+    CHROMADB_LOAD_PAGE_SIZE (int): Number of stored turns read per page on startup.
+    EMBEDDING_MAX_CHARS (int): Characters of a conversation turn passed to the embedding model.
+    CHROMADB_COLLECTION_METADATA (dict): HNSW settings of new conversation collections.
+    CHROMADB_SQLITE_WAL (bool): Whether ChromaDB's SQLite store uses write-ahead logging.
+    RESPONSE_CACHE_ENABLED (bool): Whether the VDB agents answer repeated queries from a cache.
+    RESPONSE_CACHE_SIMILARITY_THRESHOLD (float): Minimum query similarity of a cached response.
+    RESPONSE_CACHE_SIZE (int): Number of model responses kept in the response cache.
+    RESPONSE_CACHE_TTL_SECONDS (int): Seconds after which a cached response expires.
+    GRAPHITI_BATCH_SIZE (int): Number of conversation turns buffered per Graphiti write.
+    GRAPHITI_INGESTION_SECONDS (float): Seconds Graphiti is given to ingest written episodes.
+    GRAPHITI_SEARCH_CACHE_SIZE (int): Number of Graphiti search results kept in memory.
+    GRAPHITI_SEARCH_CACHE_TTL_SECONDS (float): Seconds after which a Graphiti search is repeated.
+    BASELINE_SYSTEM_PROMPT (str): System prompt for the memoryless baseline agent.
     BASELINE_MEMORY_PROMPT (str): System prompt for memory agent operations.
 """
 
+import os
+
 GRAPHITI_MCP_URL = "http://localhost:8000/mcp"
 """str: URL for the Graphiti MCP (Model Context Protocol) server endpoint."""
 
@@ -23,6 +46,159 @@ GRAPHITI_VDB_CHROMADB_DIR = "./graphiti_vdb_chroma_memory_db"
 BASELINE_CHROMADB_DIR = "./baseline_chroma_memory_db"
 """str: Directory path for storing baseline ChromaDB conversation history."""
 
+MMR_FETCH_K = 20
+"""int: Number of most similar conversations fetched as candidates for MMR."""
+
+MMR_TOP_K = 3
+"""int: Number of conversations selected from the candidates by MMR.
+
+Maximal marginal relevance picks conversations that are similar to the query
+but not to the conversations picked before, so near-duplicate turns do not
+crowd out other relevant context. All selected conversations are included in
+the context message.
+"""
+
+MMR_LAMBDA = 0.5
+"""float: Weight of query similarity versus diversity in MMR, between 0 and 1."""
+
+MIN_RELEVANCE_SCORE = 0.2
+"""float: Minimum cosine similarity to the query of a conversation considered for MMR.
+
+Conversations below it are unrelated to the query and are dropped before the
+selection, so they neither cost selection steps nor add tokens to the context.
+"""
+
+CHECKPOINTER_MAX_THREADS = 1000
+"""int: Maximum number of conversation threads kept by the in-memory checkpointer.
+
+Checkpoints of the least recently used thread are dropped once this limit is
+exceeded, so long-running agents do not grow without bound.
+"""
+
+CHROMADB_BATCH_SIZE = 1
+"""int: Number of conversation turns buffered before they are inserted into ChromaDB.
+
+Each insert is a separate transaction on the persistent store, so bulk ingestion
+is considerably faster with batches of 50-250 turns. The default of 1 writes
+every turn immediately, which the memory agents rely on to retrieve the previous
+turn in the next one.
+"""
+
+CHROMADB_SEARCH_CACHE_SIZE = 256
+"""int: Number of conversation search results memoized by the ChromaDB manager.
+
+The cache is invalidated whenever new turns are stored, so repeated searches
+for the same message within a turn are answered without re-embedding the query.
+"""
+
+QUERY_EMBEDDING_CACHE_SIZE = 2048
+"""int: Number of search query embeddings kept in an LRU cache.
+
+Unlike search results, query embeddings do not change when new turns are
+stored, so repeated queries never run the embedding model twice.
+"""
+
+CHROMADB_LOAD_PAGE_SIZE = 1000
+"""int: Number of stored conversation turns read from ChromaDB per page on startup.
+
+The in-memory vector index is rebuilt page by page, so the float32 embeddings of
+a large collection are never materialized all at once.
+"""
+
+EMBEDDING_MAX_CHARS = 4096
+"""int: Number of leading characters of a conversation turn that are embedded.
+
+all-MiniLM-L6-v2 truncates its input to 256 word pieces, so the tail of a long
+turn never reaches the model but is still tokenized. 4096 characters cover 256
+word pieces for practically any text, so embeddings do not change while long
+AI responses are no longer tokenized in full. The user message comes first in
+the stored text, so it is always part of the embedding.
+"""
+
+CHROMADB_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": int(os.getenv("CHROMADB_HNSW_M", "16")),
+    "hnsw:construction_ef": int(os.getenv("CHROMADB_HNSW_CONSTRUCTION_EF", "100")),
+    "hnsw:search_ef": int(os.getenv("CHROMADB_HNSW_SEARCH_EF", "100")),
+    "hnsw:batch_size": int(os.getenv("CHROMADB_HNSW_BATCH_SIZE", "1000")),
+    "hnsw:sync_threshold": int(os.getenv("CHROMADB_HNSW_SYNC_THRESHOLD", "2000")),
+}
+"""dict: Metadata, including the HNSW index settings, of new conversation collections.
+
+Searches are answered from the in-memory vector index, so ChromaDB's HNSW index
+is only maintained on insert. The graph parameters therefore match Chroma's own
+defaults and do not raise the build cost, while the batch size and sync
+threshold are raised from 100 and 1000, so new turns are indexed and persisted
+to disk in fewer, larger steps. Deployments can tune the index through the
+CHROMADB_HNSW_M, CHROMADB_HNSW_CONSTRUCTION_EF, CHROMADB_HNSW_SEARCH_EF,
+CHROMADB_HNSW_BATCH_SIZE and CHROMADB_HNSW_SYNC_THRESHOLD environment
+variables. The settings only take effect when a collection is created,
+existing collections keep theirs.
+"""
+
+CHROMADB_SQLITE_WAL = os.getenv("CHROMADB_SQLITE_WAL", "false").lower() == "true"
+"""bool: Whether ChromaDB's SQLite store is switched to write-ahead logging.
+
+ChromaDB keeps its SQLite file in rollback journal mode, which syncs the journal
+and the database on every insert. In WAL mode a commit appends to the log
+instead, which speeds up inserting single turns. The journal mode is stored in
+the database file and relies on ChromaDB's file layout, so it is only enabled
+if the CHROMADB_SQLITE_WAL environment variable is set to "true".
+"""
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "false").lower() == "true"
+"""bool: Whether the VDB agents answer repeated queries from a semantic response cache.
+
+A cached response skips retrieval and the model call, so it does not reflect
+memories stored after it was cached. The cache is therefore disabled unless the
+RESPONSE_CACHE_ENABLED environment variable is set to "true".
+"""
+
+RESPONSE_CACHE_SIMILARITY_THRESHOLD = 0.95
+"""float: Minimum cosine similarity between two queries to reuse a cached response."""
+
+RESPONSE_CACHE_SIZE = 1024
+"""int: Number of model responses kept in the semantic response cache."""
+
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+"""int: Seconds after which a cached model response expires."""
+
+GRAPHITI_BATCH_SIZE = 1
+"""int: Number of conversation turns buffered before they are written to Graphiti.
+
+Each turn is written as one episode through the MCP server, and the next
+Graphiti retrieval waits for them to be ingested. With larger batches, the
+turns in between return without any MCP round trip or wait. The default of 1
+writes every turn immediately, which the memory agents rely on to retrieve the
+previous turn in the next one.
+"""
+
+GRAPHITI_INGESTION_SECONDS = 10.0
+"""float: Seconds Graphiti is given to ingest episodes before they are retrieved.
+
+The MCP server queues written episodes and extracts entities and facts from
+them in the background. Instead of blocking the turn that wrote them, the next
+Graphiti retrieval of the same thread waits until this time has passed since
+the write, so time spent by the user on the next message counts towards it.
+"""
+
+GRAPHITI_SEARCH_CACHE_SIZE = 256
+"""int: Number of Graphiti search results memoized per retrieval middleware.
+
+Results are keyed by thread and query and dropped once episodes of the thread
+are written, so repeated queries between two writes skip both MCP searches.
+"""
+
+GRAPHITI_SEARCH_CACHE_TTL_SECONDS = 60.0
+"""float: Seconds after which a memoized Graphiti search result is repeated.
+
+Graphiti may still be extracting earlier episodes, or other clients may write
+to the graph, so results are also refreshed after this time.
+"""
+
+BASELINE_SYSTEM_PROMPT = "You are a memory agent that helps the user to solve tasks."
+"""str: System prompt for the baseline agent without long-term memory."""
+
 BASELINE_MEMORY_PROMPT = """You are a memory agent that helps the user to solve tasks.
 Your conversation history is automatically stored and retrieved to provide context.
 
@@ -1,54 +1,71 @@
-import time
+import asyncio
+import atexit
+import threading
 from langchain.agents.middleware import AgentMiddleware
 from typing import Any
 from langchain.agents.middleware import (
     AgentState,
 )
-from langchain_core.messages.utils import AnyMessage
 from langgraph.runtime import Runtime
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_core.tools import BaseTool
 
+from memory_agents.core.config import GRAPHITI_BATCH_SIZE
 from memory_agents.core.utils.agent_state_utils import (
-    MessageType,
-    get_latest_message_from_agent_state,
+    get_latest_conversation_turn_from_agent_state,
     get_thread_id_in_state,
 )
+from memory_agents.core.utils.graphiti_ingestion import mark_episodes_written
+from memory_agents.core.utils.message_conversion_utils import (
+    ensure_message_content_is_str,
+)
 from memory_agents.core.utils.sync_runner import ThreadedSyncRunner
 
 
 class GraphitiAugmentationMiddleware(AgentMiddleware, ThreadedSyncRunner):
     """Middleware for augmenting conversations with Graphiti memory storage.
 
-    This middleware captures user and AI messages after each interaction
-    and stores them as episodic memories in Graphiti for future retrieval.
+    This middleware reads the user and AI messages of each interaction from
+    the agent state and stores them as episodic memories in Graphiti for
+    future retrieval. Episodes are buffered and written once batch_size turns
+    are pending; the buffer is shared by all conversations of an instance.
     Creates a thread to run async function to completion, due to async interfaces from dependencies.
 
     Attributes:
-        pending_user_message (AnyMessage | None): The most recent user message
-            waiting to be processed for memory storage.
         graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
             for memory operations, specifically the 'add_memory' tool.
+        batch_size (int): Number of conversation turns buffered before they are
+            written to Graphiti.
     """
 
-    def __init__(self, graphiti_tools: dict[str, BaseTool]):
+    def __init__(
+        self, graphiti_tools: dict[str, BaseTool], batch_size: int = GRAPHITI_BATCH_SIZE
+    ):
         """Initialize the Graphiti augmentation middleware.
 
         Args:
             graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
                 for memory operations. Must include an 'add_memory' tool.
+            batch_size (int): Number of conversation turns buffered before they
+                are written to Graphiti. Defaults to GRAPHITI_BATCH_SIZE from config.
         """
         ThreadedSyncRunner.__init__(self)
-        self.pending_user_message: AnyMessage | None = None
         self.graphiti_tools = graphiti_tools
+        self.batch_size = batch_size
+        # Episodes are buffered with the thread they belong to, so every
+        # thread in a written batch is marked for ingestion.
+        self._pending_episodes: list[tuple[str, dict[str, Any]]] = []
+        self._pending_lock = threading.Lock()
+        # Buffered turns would otherwise be lost when the process exits.
+        atexit.register(self.flush)
 
-    def before_model(
-        self, state: AgentState, runtime: Runtime
-    ) -> dict[str, Any] | None:
-        """Extract and store the latest user message before model processing.
+    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        """Process and store conversation turn in Graphiti after model response.
 
-        This method captures the most recent human message from the agent state
-        and stores it for later processing in the after_model hook.
+        This method extracts the latest AI response and the user message it
+        answers from the agent state to create episodic memories in Graphiti.
+        The augmentation runs asynchronously. Retrieval, not this method,
+        waits for Graphiti to ingest the written episodes.
 
         Args:
             state (AgentState): The current agent state containing messages.
@@ -57,19 +74,25 @@ class GraphitiAugmentationMiddleware(AgentMiddleware, ThreadedSyncRunner):
         Returns:
             dict[str, Any] | None: Always returns None as no state modifications
                 are needed.
+
+        Raises:
+            ValueError: If no user message, or no AI message after it, is found.
         """
-        human_message_type = MessageType.HUMAN
-        self.pending_user_message = get_latest_message_from_agent_state(
-            state, human_message_type
+        user_message, ai_message, thread_id = self._get_conversation_turn(state)
+
+        self._run_async_task(
+            self._graphiti_augmentation(user_message, ai_message, thread_id)
         )
         return None
 
-    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
-        """Process and store conversation turn in Graphiti after model response.
+    async def aafter_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously store the conversation turn in Graphiti.
 
-        This method extracts the latest AI response and pairs it with the
-        previously stored user message to create episodic memories in Graphiti.
-        The augmentation runs asynchronously with a delay to ensure proper processing.
+        Async counterpart of after_model, used when the agent is invoked with
+        ainvoke. The Graphiti tools are awaited directly on the agent's event
+        loop, avoiding the hop through the threaded sync runner.
 
         Args:
             state (AgentState): The current agent state containing messages.
@@ -80,48 +103,121 @@ class GraphitiAugmentationMiddleware(AgentMiddleware, ThreadedSyncRunner):
                 are needed.
 
         Raises:
-            ValueError: If the user message is not a HumanMessage instance.
-            ValueError: If the AI message is not an AIMessage instance.
+            ValueError: If no user message, or no AI message after it, is found.
         """
-        ai_message_type = MessageType.AI
-        ai_message = get_latest_message_from_agent_state(state, ai_message_type)
-        user_message = self.pending_user_message
+        user_message, ai_message, thread_id = self._get_conversation_turn(state)
 
-        thread_id = get_thread_id_in_state(state)
-        if not isinstance(user_message, HumanMessage):
-            raise ValueError("User message is not of the right type UserMessage")
-        if not isinstance(ai_message, AIMessage):
-            raise ValueError("AI message is not of the right type AIMessage")
-
-        self._run_async_task(
-            self._graphiti_augmentation(user_message, ai_message, thread_id)
-        )
-        time.sleep(10)
+        await self._graphiti_augmentation(user_message, ai_message, thread_id)
         return None
 
+    def _get_conversation_turn(
+        self, state: AgentState
+    ) -> tuple[HumanMessage, AIMessage, str]:
+        """Read the latest user message and its AI response from the state.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+
+        Returns:
+            tuple[HumanMessage, AIMessage, str]: A tuple containing the user
+                message, the AI message and the conversation thread identifier.
+
+        Raises:
+            ValueError: If no user message, or no AI message after it, is found.
+        """
+        user_message, ai_message = get_latest_conversation_turn_from_agent_state(state)
+        thread_id = get_thread_id_in_state(state)
+        return user_message, ai_message, thread_id
+
     async def _graphiti_augmentation(
         self, user_message: HumanMessage, ai_message: AIMessage, thread_id: str
-    ):
-        """Asynchronously store user and AI messages as episodic memories.
+    ) -> bool:
+        """Asynchronously store a conversation turn as an episodic memory.
 
-        This method creates two separate memory entries in Graphiti - one for
-        the user message and one for the AI response. These are stored as
-        episodic memories that can be retrieved in future conversations.
+        This method combines the user message and the AI response into one
+        episode, formatted like the turns stored in ChromaDB, so each turn
+        costs a single 'add_memory' call and a single extraction in Graphiti.
+        Episodes are buffered and written once batch_size turns are pending,
+        and the write is recorded so the next retrieval of every thread in
+        the batch waits for Graphiti to ingest them.
 
         Args:
             user_message (HumanMessage): The user's message content to store.
             ai_message (AIMessage): The AI's response content to store.
             thread_id (str): The conversation thread identifier for context.
+
+        Returns:
+            bool: True if the buffered episodes were written, False if the
+                turn was only buffered.
         """
-        await self.graphiti_tools["add_memory"].ainvoke(
-            {
-                "name": "User Message",
-                "episode_body": user_message.content,
-            }
-        )
-        await self.graphiti_tools["add_memory"].ainvoke(
-            {
-                "name": "AI Message",
-                "episode_body": ai_message.content,
-            }
+        user_message_content = ensure_message_content_is_str(user_message.content)
+        ai_message_content = ensure_message_content_is_str(ai_message.content)
+        with self._pending_lock:
+            self._pending_episodes.append(
+                (
+                    thread_id,
+                    {
+                        "name": "Conversation Turn",
+                        "episode_body": f"User: {user_message_content}\n\n"
+                        f"Assistant: {ai_message_content}",
+                    },
+                )
+            )
+            if len(self._pending_episodes) < self.batch_size:
+                return False
+            episodes, self._pending_episodes = self._pending_episodes, []
+
+        await self._add_episodes(episodes)
+        return True
+
+    async def _add_episodes(self, episodes: list[tuple[str, dict[str, Any]]]) -> None:
+        """Write episodes to Graphiti concurrently and record the write.
+
+        The 'add_memory' calls are independent requests, so they are sent
+        together and the write takes one round trip instead of one per
+        episode. They are dispatched in order, but Graphiti may receive them
+        in a different one. Every thread with an episode in the batch is
+        marked as written.
+
+        Args:
+            episodes (list[tuple[str, dict[str, Any]]]): Pairs of the thread ID
+                and the arguments of the 'add_memory' tool, one per episode.
+        """
+        await asyncio.gather(
+            *(
+                self.graphiti_tools["add_memory"].ainvoke(episode)
+                for _, episode in episodes
+            )
         )
+        for thread_id in {thread_id for thread_id, _ in episodes}:
+            mark_episodes_written(thread_id)
+
+    def flush(self) -> None:
+        """Write all buffered episodes to Graphiti.
+
+        The threads of the written episodes are marked as written, like after
+        a full batch. Does nothing if no episodes are pending.
+        """
+        with self._pending_lock:
+            episodes, self._pending_episodes = self._pending_episodes, []
+        if episodes:
+            self._run_async_task(self._add_episodes(episodes))
+
+    def clear_pending_episodes(self) -> None:
+        """Discard all buffered episodes without writing them to Graphiti.
+
+        Used when the graph is cleared, so buffered turns of the discarded
+        memory are not written to the cleared graph later.
+        """
+        with self._pending_lock:
+            self._pending_episodes = []
+
+    def close(self) -> None:
+        """Write all buffered episodes and remove the exit hook.
+
+        The exit hook keeps the middleware and its Graphiti tools alive until
+        the process exits, so middlewares that are discarded before should be
+        closed. No further turns must be stored afterwards.
+        """
+        self.flush()
+        atexit.unregister(self.flush)
@@ -8,6 +8,7 @@ from langgraph.runtime import Runtime
 from memory_agents.core.middleware.graphiti_retrieval_middleware_utils import (
     GraphitiRetrievalMiddlewareUtils,
 )
+from memory_agents.core.utils.retrieval_gate import should_retrieve
 
 
 class GraphitiRetrievalMiddleware(AgentMiddleware, GraphitiRetrievalMiddlewareUtils):
@@ -15,7 +16,8 @@ class GraphitiRetrievalMiddleware(AgentMiddleware, GraphitiRetrievalMiddlewareUt
 
     This middleware searches Graphiti for relevant nodes and memory facts based on
     the user's latest message and injects this context as a system message to
-    inform the AI's response.
+    inform the AI's response. Retrieval is skipped for acknowledgements and
+    model calls that do not follow a user message.
 
     Attributes:
         graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
@@ -50,11 +52,49 @@ class GraphitiRetrievalMiddleware(AgentMiddleware, GraphitiRetrievalMiddlewareUt
         Returns:
             dict[str, Any] | None: Always returns None as state is modified in place.
         """
+        if not should_retrieve(state):
+            return None
+
         nodes, memory_facts = self._retrieve_graphiti_with_user_message(state)
-        retrieval_context = self._build_graphiti_augmentation_context_message(
-            (nodes, memory_facts)
-        )
+        self._append_retrieval_context(state, (nodes, memory_facts))
+        return None
+
+    async def abefore_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously retrieve relevant memories and inject them as context.
+
+        Async counterpart of before_model, used when the agent is invoked with
+        ainvoke. The Graphiti searches are awaited on the agent's event loop,
+        avoiding the hop through the threaded sync runner.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
 
-        system_message = SystemMessage(content=retrieval_context)
-        state["messages"].append(system_message)
+        Returns:
+            dict[str, Any] | None: Always returns None as state is modified in place.
+        """
+        if not should_retrieve(state):
+            return None
+
+        nodes, memory_facts = await self._aretrieve_graphiti_with_user_message(state)
+        self._append_retrieval_context(state, (nodes, memory_facts))
         return None
+
+    def _append_retrieval_context(
+        self, state: AgentState, nodes_and_memory_facts: tuple[str, str]
+    ) -> None:
+        """Build the Graphiti context message and append it to the agent state.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            nodes_and_memory_facts (tuple[str, str]): A tuple containing
+                (nodes, memory_facts) retrieved from Graphiti.
+        """
+        retrieval_context = self._build_graphiti_augmentation_context_message(
+            nodes_and_memory_facts
+        )
+        if retrieval_context:
+            system_message = SystemMessage(content=retrieval_context)
+            state["messages"].append(system_message)
@@ -1,3 +1,8 @@
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Tuple
 from langchain.agents.middleware import AgentState
 import logging
@@ -7,6 +12,14 @@ from memory_agents.core.utils.agent_state_utils import (
     get_latest_message_from_agent_state,
     get_thread_id_in_state,
 )
+from memory_agents.core.config import (
+    GRAPHITI_SEARCH_CACHE_SIZE,
+    GRAPHITI_SEARCH_CACHE_TTL_SECONDS,
+)
+from memory_agents.core.utils.graphiti_ingestion import (
+    get_ingestion_time,
+    wait_for_episode_ingestion,
+)
 from memory_agents.core.utils.message_conversion_utils import (
     ensure_message_content_is_str,
 )
@@ -18,6 +31,8 @@ class GraphitiRetrievalMiddlewareUtils(ThreadedSyncRunner):
 
     This class contains helper methods for retrieving relevant memories from
     Graphiti based on user queries and building context messages for AI responses.
+    Search results are memoized per thread and query until episodes of the
+    thread are written or GRAPHITI_SEARCH_CACHE_TTL_SECONDS have passed.
     Creates a thread to run async function to completion, due to async interfaces from dependencies.
 
     Attributes:
@@ -30,11 +45,25 @@ class GraphitiRetrievalMiddlewareUtils(ThreadedSyncRunner):
     def __init__(self):
         """Initialize the Graphiti retrieval utilities.
 
-        Sets up the logger and initializes the threaded sync runner functionality.
+        Sets up the logger, the search cache and the threaded sync runner
+        functionality.
         """
         self.logger = logging.getLogger()
+        self._graphiti_search_cache: OrderedDict[
+            tuple[str, str], tuple[float, Tuple[str, str]]
+        ] = OrderedDict()
+        self._graphiti_search_cache_lock = threading.Lock()
         ThreadedSyncRunner.__init__(self)
 
+    def clear_search_cache(self) -> None:
+        """Discard all memoized Graphiti search results.
+
+        Must be called after the graph is cleared, since memoized results of
+        the deleted graph would otherwise be returned until they expire.
+        """
+        with self._graphiti_search_cache_lock:
+            self._graphiti_search_cache.clear()
+
     def _retrieve_graphiti_with_user_message(
         self, state: AgentState
     ) -> Tuple[str, str]:
@@ -51,17 +80,50 @@ class GraphitiRetrievalMiddlewareUtils(ThreadedSyncRunner):
             Tuple[str, str]: A tuple containing (nodes, memory_facts) retrieved
                 from Graphiti based on the user's query.
         """
+        graphiti_query, thread_id = self._get_graphiti_query_and_thread_id(state)
+
+        return self._run_async_task(self._graphiti_retrieval(graphiti_query, thread_id))
+
+    async def _aretrieve_graphiti_with_user_message(
+        self, state: AgentState
+    ) -> Tuple[str, str]:
+        """Asynchronously retrieve relevant Graphiti memories for the latest message.
+
+        Async counterpart of _retrieve_graphiti_with_user_message. The Graphiti
+        tools are awaited directly on the caller's event loop instead of being
+        dispatched to the background loop of the threaded sync runner.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+
+        Returns:
+            Tuple[str, str]: A tuple containing (nodes, memory_facts) retrieved
+                from Graphiti based on the user's query.
+        """
+        graphiti_query, thread_id = self._get_graphiti_query_and_thread_id(state)
+
+        return await self._graphiti_retrieval(graphiti_query, thread_id)
+
+    def _get_graphiti_query_and_thread_id(self, state: AgentState) -> Tuple[str, str]:
+        """Extract the Graphiti search query and thread ID from the agent state.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+
+        Returns:
+            Tuple[str, str]: A tuple containing (graphiti_query, thread_id), where
+                the query is the content of the latest human message.
+        """
         human_message_type = MessageType.HUMAN
         message = get_latest_message_from_agent_state(state, human_message_type)
         thread_id = get_thread_id_in_state(state)
 
         graphiti_query = ensure_message_content_is_str(message.content)
-
-        return self._run_async_task(self._graphiti_retrieval(graphiti_query, thread_id))
+        return graphiti_query, thread_id
 
     def _build_graphiti_augmentation_context_message(
         self, nodes_and_memory_facts: Tuple[str, str]
-    ) -> str:
+    ) -> str | None:
         """Build a context message from retrieved Graphiti nodes and memory facts.
 
         This method formats the retrieved nodes and memory facts into a structured
@@ -73,10 +135,13 @@ class GraphitiRetrievalMiddlewareUtils(ThreadedSyncRunner):
                 retrieved from Graphiti.
 
         Returns:
-            str: A formatted context message containing the retrieved information
-                with instructions for appropriate usage.
+            str | None: A formatted context message containing the retrieved
+                information with instructions for appropriate usage, or None if
+                Graphiti found neither nodes nor memory facts.
         """
         nodes, memory_facts = nodes_and_memory_facts
+        if _is_empty_graphiti_result(nodes) and _is_empty_graphiti_result(memory_facts):
+            return None
 
         retrieval_context = f"""
             <retrieved_context>
@@ -110,14 +175,89 @@ class GraphitiRetrievalMiddlewareUtils(ThreadedSyncRunner):
             Tuple[str, str]: A tuple containing (nodes, memory_facts) retrieved
                 from Graphiti based on the query.
         """
-        nodes = await self.graphiti_tools["search_nodes"].ainvoke(
-            {
-                "query": graphiti_query,
-            }
-        )
-        memory_facts = await self.graphiti_tools["search_memory_facts"].ainvoke(
-            {
-                "query": graphiti_query,
-            }
+        await wait_for_episode_ingestion(thread_id)
+
+        cache_key = (thread_id, graphiti_query)
+        cached = self._get_cached_graphiti_search(cache_key)
+        if cached is not None:
+            return cached
+
+        # Both searches are independent MCP calls, so they run concurrently and
+        # retrieval takes as long as the slower one.
+        nodes, memory_facts = await asyncio.gather(
+            self.graphiti_tools["search_nodes"].ainvoke({"query": graphiti_query}),
+            self.graphiti_tools["search_memory_facts"].ainvoke(
+                {"query": graphiti_query}
+            ),
         )
+        with self._graphiti_search_cache_lock:
+            self._graphiti_search_cache[cache_key] = (
+                time.monotonic(),
+                (nodes, memory_facts),
+            )
+            if len(self._graphiti_search_cache) > GRAPHITI_SEARCH_CACHE_SIZE:
+                self._graphiti_search_cache.popitem(last=False)
         return nodes, memory_facts
+
+    def _get_cached_graphiti_search(
+        self, cache_key: tuple[str, str]
+    ) -> Tuple[str, str] | None:
+        """Return a memoized Graphiti search result if it is still valid.
+
+        A result is valid if it was searched after the episodes last written
+        for the thread were ingested and is younger than
+        GRAPHITI_SEARCH_CACHE_TTL_SECONDS.
+
+        Args:
+            cache_key (tuple[str, str]): The thread ID and the search query.
+
+        Returns:
+            Tuple[str, str] | None: The memoized (nodes, memory_facts), or None
+                if there is no valid result.
+        """
+        with self._graphiti_search_cache_lock:
+            entry = self._graphiti_search_cache.get(cache_key)
+            if entry is None:
+                return None
+            searched_at, result = entry
+            if (
+                searched_at < get_ingestion_time(cache_key[0])
+                or time.monotonic() - searched_at > GRAPHITI_SEARCH_CACHE_TTL_SECONDS
+            ):
+                del self._graphiti_search_cache[cache_key]
+                return None
+            self._graphiti_search_cache.move_to_end(cache_key)
+            return result
+
+
+def _is_empty_graphiti_result(result: Any) -> bool:
+    """Check whether a Graphiti search result contains no nodes or facts.
+
+    The Graphiti MCP tools answer with a JSON object such as
+    ``{"message": "No relevant nodes found", "nodes": []}``, either as a string
+    or as a list of text content blocks.
+
+    Args:
+        result (Any): The result of a Graphiti search tool.
+
+    Returns:
+        bool: True if the result is empty or only holds empty "nodes" or
+            "facts" lists, False if it may contain relevant information.
+    """
+    if not result:
+        return True
+
+    blocks = result if isinstance(result, list) else [result]
+    for block in blocks:
+        text = block.get("text", "") if isinstance(block, dict) else str(block)
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            return False
+        if not isinstance(payload, dict):
+            return False
+        if payload.get("nodes") or payload.get("facts"):
+            return False
+        if "nodes" not in payload and "facts" not in payload:
+            return False
+    return True
@@ -0,0 +1,97 @@
+from typing import Any
+
+from langchain.agents.middleware import AgentState
+from langchain_core.tools import BaseTool
+from langgraph.runtime import Runtime
+
+from memory_agents.core.chroma_db_manager import ChromaDBManager
+from memory_agents.core.middleware.graphiti_augmentation_middleware import (
+    GraphitiAugmentationMiddleware,
+)
+from memory_agents.core.middleware.vdb_augmentation_middleware import (
+    VDBAugmentationMiddleware,
+)
+
+
+class GraphitiVDBAugmentationMiddleware(
+    GraphitiAugmentationMiddleware, VDBAugmentationMiddleware
+):
+    """Middleware for storing conversations in both Graphiti and vector database.
+
+    This middleware combines the Graphiti and VDB augmentation middlewares.
+    Both stores are independent, so each conversation turn is written to
+    Graphiti and ChromaDB concurrently instead of one after the other.
+
+    Attributes:
+        graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
+            for memory operations, specifically the 'add_memory' tool.
+        chroma_manager (ChromaDBManager): Manager for ChromaDB operations.
+    """
+
+    def __init__(
+        self, graphiti_tools: dict[str, BaseTool], chroma_manager: ChromaDBManager
+    ):
+        """Initialize the combined Graphiti and VDB augmentation middleware.
+
+        Args:
+            graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
+                for memory operations. Must include an 'add_memory' tool.
+            chroma_manager (ChromaDBManager): Manager for ChromaDB vector storage operations.
+        """
+        GraphitiAugmentationMiddleware.__init__(self, graphiti_tools)
+        self.chroma_manager = chroma_manager
+
+    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        """Store the conversation turn in Graphiti and ChromaDB after model response.
+
+        The turn is read from the state once and handed to both memories. The
+        Graphiti episodes are written on the threaded sync runner while the
+        turn is submitted for a background ChromaDB insert. The method waits
+        for the Graphiti write, while ingesting the episodes is waited for by
+        the next Graphiti retrieval.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: Always returns None as no state modifications
+                are needed.
+
+        Raises:
+            ValueError: If no user message, or no AI message after it, is found.
+        """
+        user_message, ai_message, thread_id = self._get_conversation_turn(state)
+
+        graphiti_future = self._submit_async_task(
+            self._graphiti_augmentation(user_message, ai_message, thread_id)
+        )
+        self._add_conversation_turn(user_message, ai_message, thread_id)
+        graphiti_future.result()
+        return None
+
+    async def aafter_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously store the conversation turn in Graphiti and ChromaDB.
+
+        Async counterpart of after_model, used when the agent is invoked with
+        ainvoke. The Graphiti tools are awaited on the agent's event loop while
+        the turn is stored by the ChromaDB manager's writer thread.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: Always returns None as no state modifications
+                are needed.
+
+        Raises:
+            ValueError: If no user message, or no AI message after it, is found.
+        """
+        user_message, ai_message, thread_id = self._get_conversation_turn(state)
+
+        self._add_conversation_turn(user_message, ai_message, thread_id)
+        await self._graphiti_augmentation(user_message, ai_message, thread_id)
+        return None
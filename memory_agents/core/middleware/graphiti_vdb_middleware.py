@@ -0,0 +1,49 @@
+from langchain_core.tools import BaseTool
+
+from memory_agents.core.chroma_db_manager import ChromaDBManager
+from memory_agents.core.middleware.graphiti_augmentation_middleware import (
+    GraphitiAugmentationMiddleware,
+)
+from memory_agents.core.middleware.graphiti_retrieval_middleware_utils import (
+    GraphitiRetrievalMiddlewareUtils,
+)
+from memory_agents.core.middleware.graphiti_vdb_augmentation_middleware import (
+    GraphitiVDBAugmentationMiddleware,
+)
+from memory_agents.core.middleware.graphiti_vdb_retrieval_middleware import (
+    GraphitiVDBRetrievalMiddleware,
+)
+
+
+class GraphitiVDBMiddleware(
+    GraphitiVDBRetrievalMiddleware, GraphitiVDBAugmentationMiddleware
+):
+    """Middleware for retrieving and storing memories in Graphiti and vector database.
+
+    This middleware fuses the Graphiti and VDB retrieval and augmentation
+    middlewares into one. Its before_model hooks retrieve and inject the
+    combined context, its after_model hooks store the conversation turn in
+    both memories. Compared to wiring the retrieval and augmentation
+    middlewares separately, the agent registers a single middleware that
+    shares the Graphiti tools and the ChromaDB manager between both phases.
+
+    Attributes:
+        chroma_manager (ChromaDBManager): Manager for ChromaDB operations.
+        graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
+            for memory operations, including 'search_nodes',
+            'search_memory_facts' and 'add_memory'.
+    """
+
+    def __init__(
+        self, graphiti_tools: dict[str, BaseTool], chroma_manager: ChromaDBManager
+    ):
+        """Initialize the fused Graphiti and VDB middleware.
+
+        Args:
+            graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
+                for memory retrieval and storage operations.
+            chroma_manager (ChromaDBManager): Manager for ChromaDB vector storage operations.
+        """
+        GraphitiAugmentationMiddleware.__init__(self, graphiti_tools)
+        GraphitiRetrievalMiddlewareUtils.__init__(self)
+        self.chroma_manager = chroma_manager
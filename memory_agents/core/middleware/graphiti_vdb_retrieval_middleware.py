@@ -1,6 +1,8 @@
-from typing import Any
+import asyncio
+from typing import Any, Sequence
 from langchain.agents.middleware import AgentMiddleware, AgentState
 
+from langchain_core.documents import Document
 from langchain_core.messages import SystemMessage
 from langchain_core.tools import BaseTool
 from langgraph.runtime import Runtime
@@ -9,14 +11,10 @@ from memory_agents.core.chroma_db_manager import ChromaDBManager
 from memory_agents.core.middleware.graphiti_retrieval_middleware_utils import (
     GraphitiRetrievalMiddlewareUtils,
 )
-from langchain_community.document_compressors.flashrank_rerank import (
-    FlashrankRerank,
-    Ranker,
-)
-
 from memory_agents.core.middleware.vdb_retrieval_middlware_utils import (
     VDBRetrievalMiddlewareUtils,
 )
+from memory_agents.core.utils.retrieval_gate import should_retrieve
 
 
 class GraphitiVDBRetrievalMiddleware(
@@ -26,12 +24,13 @@ class GraphitiVDBRetrievalMiddleware(
 
     This middleware combines memory retrieval from Graphiti knowledge graphs
     and ChromaDB vector storage, providing comprehensive context by searching
-    both structured and unstructured memory sources. It also includes reranking
-    to prioritize the most relevant results.
+    both structured and unstructured memory sources. VDB results are selected
+    by maximal marginal relevance to keep them relevant but diverse. Retrieval
+    is skipped for acknowledgements and model calls that do not follow a user
+    message.
 
     Attributes:
         chroma_manager (ChromaDBManager): Manager for ChromaDB operations.
-        reranker (FlashrankRerank): Reranking component for improving result relevance.
         graphiti_tools (dict[str, BaseTool]): Dictionary containing Graphiti tools
             for memory retrieval operations.
     """
@@ -48,8 +47,6 @@ class GraphitiVDBRetrievalMiddleware(
         """
         super().__init__()
         self.chroma_manager: ChromaDBManager = chroma_manager
-        ranker = Ranker()
-        self.reranker: FlashrankRerank = FlashrankRerank(client=ranker, top_n=5)
         self.graphiti_tools = graphiti_tools
 
     def before_model(
@@ -59,7 +56,40 @@ class GraphitiVDBRetrievalMiddleware(
 
         This method searches both Graphiti and ChromaDB for relevant memories based on
         the user's latest message, combines the results, and injects them as context
-        to inform the AI's response.
+        to inform the AI's response. The Graphiti searches run on the threaded sync
+        runner while ChromaDB is searched in the calling thread, so retrieval takes
+        as long as the slower of the two. The user's message is read from the
+        state once and used as the query of both searches.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: Always returns None as state is modified in place.
+        """
+        if not should_retrieve(state):
+            return None
+
+        query, thread_id = self._get_graphiti_query_and_thread_id(state)
+        graphiti_future = self._submit_async_task(
+            self._graphiti_retrieval(query, thread_id)
+        )
+        documents = self._retrieve_chroma_db(query)
+        nodes, memory_facts = graphiti_future.result()
+        self._append_retrieval_context(state, (nodes, memory_facts), documents)
+        return None
+
+    async def abefore_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously retrieve and combine memories from Graphiti and VDB.
+
+        Async counterpart of before_model, used when the agent is invoked with
+        ainvoke. The Graphiti searches are awaited on the agent's event loop
+        while the blocking ChromaDB search and selection run concurrently in a
+        worker thread, so retrieval takes as long as the slower of the two and
+        the event loop is never blocked.
 
         Args:
             state (AgentState): The current agent state containing messages.
@@ -68,22 +98,45 @@ class GraphitiVDBRetrievalMiddleware(
         Returns:
             dict[str, Any] | None: Always returns None as state is modified in place.
         """
-        nodes, memory_facts = self._retrieve_graphiti_with_user_message(state)
+        if not should_retrieve(state):
+            return None
+
+        query, thread_id = self._get_graphiti_query_and_thread_id(state)
+        (nodes, memory_facts), documents = await asyncio.gather(
+            self._graphiti_retrieval(query, thread_id),
+            asyncio.to_thread(self._retrieve_chroma_db, query),
+        )
+        self._append_retrieval_context(state, (nodes, memory_facts), documents)
+        return None
+
+    def _append_retrieval_context(
+        self,
+        state: AgentState,
+        nodes_and_memory_facts: tuple[str, str],
+        documents: Sequence[Document] | None,
+    ) -> None:
+        """Combine the Graphiti and VDB context messages and append them to the state.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            nodes_and_memory_facts (tuple[str, str]): A tuple containing
+                (nodes, memory_facts) retrieved from Graphiti.
+            documents (Sequence[Document] | None): Documents retrieved from ChromaDB
+                and selected by MMR, or None if nothing was found.
+        """
         retrieval_context_graphiti = self._build_graphiti_augmentation_context_message(
-            (nodes, memory_facts)
+            nodes_and_memory_facts
         )
-        documents = self._retrieve_chroma_db_with_user_message(state)
         retrieval_context_vdb = (
             self._build_vdb_augmentation_context_message(documents)
             if documents
             else None
         )
-        retrieval_context = (
-            retrieval_context_graphiti + "\n\n" + retrieval_context_vdb
-            if retrieval_context_vdb
-            else retrieval_context_graphiti
+        retrieval_context = "\n\n".join(
+            context
+            for context in (retrieval_context_graphiti, retrieval_context_vdb)
+            if context
         )
         if retrieval_context:
             system_message = SystemMessage(content=retrieval_context)
             state["messages"].append(system_message)
-        return None
@@ -0,0 +1,145 @@
+import asyncio
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, AgentState, hook_config
+from langchain_core.messages import AIMessage
+from langgraph.runtime import Runtime
+
+from memory_agents.core.utils.agent_state_utils import (
+    MessageType,
+    get_latest_conversation_turn_from_agent_state,
+    get_latest_message_from_agent_state,
+    get_thread_id_in_state,
+)
+from memory_agents.core.utils.message_conversion_utils import (
+    ensure_message_content_is_str,
+)
+from memory_agents.core.utils.semantic_response_cache import SemanticResponseCache
+
+
+class SemanticResponseCacheMiddleware(AgentMiddleware):
+    """Middleware answering repeated user queries from a semantic response cache.
+
+    Before the model runs, the latest user message is looked up in the cache.
+    On a hit, the cached response is appended as the AI message and the agent
+    jumps to the end, skipping the memory retrieval of the following
+    middlewares and the model call. After the model answered without calling
+    tools, the response is cached for the user message. The middleware should
+    be placed before the retrieval middlewares.
+
+    Attributes:
+        response_cache (SemanticResponseCache): Cache of the model responses.
+    """
+
+    def __init__(self, response_cache: SemanticResponseCache):
+        """Initialize the semantic response cache middleware.
+
+        Args:
+            response_cache (SemanticResponseCache): Cache of the model responses,
+                shared with the agent so it can be cleared with its memory.
+        """
+        super().__init__()
+        self.response_cache = response_cache
+
+    @hook_config(can_jump_to=["end"])
+    def before_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Answer the latest user message from the cache if possible.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: The cached AI message and a jump to the end
+                of the agent on a cache hit, None otherwise.
+        """
+        return self._lookup_cached_response(state)
+
+    @hook_config(can_jump_to=["end"])
+    async def abefore_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously answer the latest user message from the cache if possible.
+
+        Async counterpart of before_model. The query is embedded in a worker
+        thread so the agent's event loop is not blocked.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: The cached AI message and a jump to the end
+                of the agent on a cache hit, None otherwise.
+        """
+        return await asyncio.to_thread(self._lookup_cached_response, state)
+
+    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        """Cache the model response to the latest user message.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: Always returns None as no state modifications
+                are needed.
+        """
+        self._cache_response(state)
+        return None
+
+    async def aafter_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously cache the model response to the latest user message.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: Always returns None as no state modifications
+                are needed.
+        """
+        await asyncio.to_thread(self._cache_response, state)
+        return None
+
+    def _lookup_cached_response(self, state: AgentState) -> dict[str, Any] | None:
+        """Look up the latest user message in the cache.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+
+        Returns:
+            dict[str, Any] | None: The cached AI message and a jump to the end
+                of the agent on a cache hit, None otherwise.
+        """
+        user_message = get_latest_message_from_agent_state(state, MessageType.HUMAN)
+        cached_response = self.response_cache.lookup(
+            ensure_message_content_is_str(user_message.content),
+            get_thread_id_in_state(state),
+        )
+        if cached_response is None:
+            return None
+
+        return {"messages": [AIMessage(content=cached_response)], "jump_to": "end"}
+
+    def _cache_response(self, state: AgentState) -> None:
+        """Cache the latest AI response for the user message it answers.
+
+        Responses requesting tool calls are intermediate steps and not cached.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+        """
+        user_message, ai_message = get_latest_conversation_turn_from_agent_state(state)
+        if getattr(ai_message, "tool_calls", None) or not ai_message.content:
+            return
+
+        self.response_cache.add(
+            ensure_message_content_is_str(user_message.content),
+            ensure_message_content_is_str(ai_message.content),
+            get_thread_id_in_state(state),
+        )
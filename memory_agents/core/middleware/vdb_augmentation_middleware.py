@@ -1,12 +1,12 @@
 from typing import Any
+from langchain_core.messages.utils import AnyMessage
 from langchain.agents.middleware import AgentMiddleware, AgentState
 from memory_agents.core.chroma_db_manager import ChromaDBManager
 
 from langgraph.runtime import Runtime
 
 from memory_agents.core.utils.agent_state_utils import (
-    MessageType,
-    get_latest_message_from_agent_state,
+    get_latest_conversation_turn_from_agent_state,
     get_thread_id_in_state,
 )
 from memory_agents.core.utils.message_conversion_utils import (
@@ -19,12 +19,12 @@ class VDBAugmentationMiddleware(AgentMiddleware):
 
     This middleware captures conversation turns (user and AI messages) and
     stores them in ChromaDB for future retrieval. It maintains context
-    across conversations by storing each interaction with metadata.
+    across conversations by storing each interaction with metadata. Both
+    messages are read from the agent state, so the middleware keeps no
+    per-turn state and one instance can serve concurrent conversations.
 
     Attributes:
         chroma_manager (ChromaDBManager): Manager for ChromaDB operations.
-        pending_user_message: The most recent user message waiting to be
-            processed for storage.
     """
 
     def __init__(self, chroma_manager: ChromaDBManager):
@@ -35,15 +35,15 @@ class VDBAugmentationMiddleware(AgentMiddleware):
         """
         super().__init__()
         self.chroma_manager = chroma_manager
-        self.pending_user_message = None
 
-    def before_model(
-        self, state: AgentState, runtime: Runtime
-    ) -> dict[str, Any] | None:
-        """Extract and store the latest user message before model processing.
+    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        """Store conversation turn in vector database after model response.
 
-        This method captures the most recent human message from the agent state
-        and stores it for later processing in the after_model hook.
+        This method reads the latest AI response and the user message it
+        answers from the agent state and stores the complete conversation turn
+        in ChromaDB with relevant metadata for future retrieval. The insert
+        runs on the ChromaDB manager's writer thread, so the method returns
+        without waiting for it.
 
         Args:
             state (AgentState): The current agent state containing messages.
@@ -52,19 +52,22 @@ class VDBAugmentationMiddleware(AgentMiddleware):
         Returns:
             dict[str, Any] | None: Always returns None as no state modifications
                 are needed.
-        """
-        human_message_type = MessageType.HUMAN
-        message = get_latest_message_from_agent_state(state, human_message_type)
 
-        self.pending_user_message = message
+        Raises:
+            ValueError: If the user message could not be retrieved.
+        """
+        self._store_conversation_turn(state)
         return None
 
-    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
-        """Store conversation turn in vector database after model response.
+    async def aafter_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously store the conversation turn in the vector database.
 
-        This method pairs the latest AI response with the previously stored
-        user message and stores the complete conversation turn in ChromaDB
-        with relevant metadata for future retrieval.
+        Async counterpart of after_model, used when the agent is invoked with
+        ainvoke. The ChromaDB insert runs on the ChromaDB manager's writer
+        thread, so the agent's event loop is not blocked while the turn is
+        embedded and stored.
 
         Args:
             state (AgentState): The current agent state containing messages.
@@ -77,23 +80,42 @@ class VDBAugmentationMiddleware(AgentMiddleware):
         Raises:
             ValueError: If the user message could not be retrieved.
         """
-        ai_message_type = MessageType.AI
-        ai_message = get_latest_message_from_agent_state(state, ai_message_type)
-        user_message = self.pending_user_message
+        self._store_conversation_turn(state)
+        return None
 
-        thread_id = get_thread_id_in_state(state)
+    def _store_conversation_turn(self, state: AgentState) -> None:
+        """Read the latest user message and its AI response and store them.
 
-        if not user_message:
-            raise ValueError("Could not retrieve user message.")
+        The turn is submitted for a background insert.
 
+        Args:
+            state (AgentState): The current agent state containing messages.
+
+        Raises:
+            ValueError: If the user message could not be retrieved.
+        """
+        user_message, ai_message = get_latest_conversation_turn_from_agent_state(state)
+        self._add_conversation_turn(
+            user_message, ai_message, get_thread_id_in_state(state)
+        )
+
+    def _add_conversation_turn(
+        self, user_message: AnyMessage, ai_message: AnyMessage, thread_id: str
+    ) -> None:
+        """Submit a conversation turn for a background insert into ChromaDB.
+
+        Args:
+            user_message (AnyMessage): The user message of the turn.
+            ai_message (AnyMessage): The AI response to the user message.
+            thread_id (str): The conversation thread identifier.
+        """
         user_message_content = ensure_message_content_is_str(user_message.content)
         ai_message_content = ensure_message_content_is_str(ai_message.content)
 
-        self.chroma_manager.add_conversation_turn(
+        self.chroma_manager.add_conversation_turn_in_background(
             user_message=user_message_content,
             ai_message=ai_message_content,
             metadata={
                 "thread_id": thread_id,
             },
         )
-        return None
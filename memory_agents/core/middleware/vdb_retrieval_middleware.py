@@ -1,29 +1,30 @@
-from typing import Any
+import asyncio
+from typing import Any, Sequence
 from memory_agents.core.chroma_db_manager import ChromaDBManager
 from langchain.agents.middleware import AgentMiddleware, AgentState
+from langchain_core.documents import Document
 from langchain_core.messages import SystemMessage
 
 from memory_agents.core.middleware.vdb_retrieval_middlware_utils import (
     VDBRetrievalMiddlewareUtils,
 )
 
-from langchain_community.document_compressors.flashrank_rerank import (
-    FlashrankRerank,
-    Ranker,
-)
 from langgraph.runtime import Runtime
 
+from memory_agents.core.utils.retrieval_gate import should_retrieve
+
 
 class VDBRetrievalMiddleware(AgentMiddleware, VDBRetrievalMiddlewareUtils):
     """Middleware for retrieving relevant memories from vector database before model processing.
 
     This middleware searches ChromaDB for relevant past conversations based on
     the user's latest message and injects this context as a system message to
-    inform the AI's response. It includes reranking to prioritize the most relevant results.
+    inform the AI's response. It selects relevant but diverse results by maximal
+    marginal relevance. Retrieval is skipped for acknowledgements and model
+    calls that do not follow a user message.
 
     Attributes:
         chroma_manager (ChromaDBManager): Manager for ChromaDB operations.
-        reranker (FlashrankRerank): Reranking component for improving result relevance.
     """
 
     def __init__(self, chroma_manager: ChromaDBManager):
@@ -34,8 +35,6 @@ class VDBRetrievalMiddleware(AgentMiddleware, VDBRetrievalMiddlewareUtils):
         """
         super().__init__()
         self.chroma_manager: ChromaDBManager = chroma_manager
-        ranker = Ranker()
-        self.reranker: FlashrankRerank = FlashrankRerank(client=ranker, top_n=5)
 
     def before_model(
         self, state: AgentState, runtime: Runtime
@@ -53,7 +52,48 @@ class VDBRetrievalMiddleware(AgentMiddleware, VDBRetrievalMiddlewareUtils):
         Returns:
             dict[str, Any] | None: Always returns None as state is modified in place.
         """
+        if not should_retrieve(state):
+            return None
+
         documents = self._retrieve_chroma_db_with_user_message(state)
+        self._append_retrieval_context(state, documents)
+        return None
+
+    async def abefore_model(
+        self, state: AgentState, runtime: Runtime
+    ) -> dict[str, Any] | None:
+        """Asynchronously retrieve relevant memories from VDB and inject them as context.
+
+        Async counterpart of before_model, used when the agent is invoked with
+        ainvoke. The blocking ChromaDB search and selection run in a worker thread
+        so the agent's event loop is not blocked during retrieval.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            runtime (Runtime): The LangChain runtime instance.
+
+        Returns:
+            dict[str, Any] | None: Always returns None as state is modified in place.
+        """
+        if not should_retrieve(state):
+            return None
+
+        documents = await asyncio.to_thread(
+            self._retrieve_chroma_db_with_user_message, state
+        )
+        self._append_retrieval_context(state, documents)
+        return None
+
+    def _append_retrieval_context(
+        self, state: AgentState, documents: Sequence[Document] | None
+    ) -> None:
+        """Build the VDB context message and append it to the agent state.
+
+        Args:
+            state (AgentState): The current agent state containing messages.
+            documents (Sequence[Document] | None): Documents retrieved from ChromaDB
+                and selected by MMR, or None if nothing was found.
+        """
         retrieval_context = (
             self._build_vdb_augmentation_context_message(documents)
             if documents
@@ -62,4 +102,3 @@ class VDBRetrievalMiddleware(AgentMiddleware, VDBRetrievalMiddlewareUtils):
         if retrieval_context:
             system_message = SystemMessage(content=retrieval_context)
             state["messages"].append(system_message)
-        return None
@@ -1,31 +1,89 @@
 from typing import Sequence
 from langchain.agents.middleware import AgentState
-from langchain_community.document_compressors import FlashrankRerank
+import numpy as np
 
 from memory_agents.core.chroma_db_manager import ChromaDBManager
+from memory_agents.core.config import (
+    MIN_RELEVANCE_SCORE,
+    MMR_FETCH_K,
+    MMR_LAMBDA,
+    MMR_TOP_K,
+)
 from memory_agents.core.utils.agent_state_utils import (
     MessageType,
     get_latest_message_from_agent_state,
 )
+from memory_agents.core.utils.message_conversion_utils import (
+    ensure_message_content_is_str,
+)
 from langchain_core.documents import Document
 import logging
 
+CONVERSATIONS_CONTEXT_HEADER = "\n--- Similar Past Conversations ---\n"
+"""str: Header preceding the retrieved conversations in the VDB context message."""
+
+
+def _maximal_marginal_relevance(
+    query_similarities: np.ndarray,
+    embeddings: np.ndarray,
+    k: int = MMR_TOP_K,
+    lambda_mult: float = MMR_LAMBDA,
+) -> list[int]:
+    """Select documents that are relevant to the query and diverse among each other.
+
+    Each step selects the candidate maximizing
+    lambda_mult * query_similarity - (1 - lambda_mult) * max_similarity, where
+    max_similarity is the highest similarity to an already selected document.
+    Only the similarities to the selected documents are computed, one
+    matrix-vector product per step, instead of the full pairwise matrix.
+
+    Args:
+        query_similarities (np.ndarray): Cosine similarity of each candidate
+            to the query.
+        embeddings (np.ndarray): Embeddings of the candidates as rows.
+        k (int): Number of candidates to select. Defaults to MMR_TOP_K.
+        lambda_mult (float): Weight of the query similarity. Defaults to
+            MMR_LAMBDA.
+
+    Returns:
+        list[int]: Indices of the selected candidates in selection order.
+    """
+    embeddings = embeddings.astype(np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    embeddings /= np.where(norms == 0, 1.0, norms)
+
+    # The query term is constant, so it is weighted once up front.
+    relevance = lambda_mult * np.asarray(query_similarities, dtype=np.float32)
+    selected = [int(np.argmax(relevance))]
+    max_similarities = embeddings @ embeddings[selected[0]]
+    scores = np.empty_like(relevance)
+    while len(selected) < min(k, len(relevance)):
+        np.multiply(max_similarities, lambda_mult - 1, out=scores)
+        scores += relevance
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        np.maximum(
+            max_similarities, embeddings @ embeddings[best], out=max_similarities
+        )
+    return selected
+
 
 class VDBRetrievalMiddlewareUtils:
     """Utility class providing vector database retrieval functionality.
 
     This class contains helper methods for retrieving relevant conversations
     from ChromaDB based on user queries and building context messages for
-    AI responses. It includes reranking to improve result relevance.
+    AI responses. Results are selected by maximal marginal relevance, so that
+    the context covers several relevant conversations instead of repeating
+    near-duplicates.
 
     Attributes:
         chroma_manager (ChromaDBManager): Manager for ChromaDB operations.
-        reranker (FlashrankRerank): Reranking component for improving result relevance.
         logger: Logger instance for debugging and error reporting.
     """
 
     chroma_manager: ChromaDBManager
-    reranker: FlashrankRerank
 
     def __init__(self):
         """Initialize the VDB retrieval utilities.
@@ -37,60 +95,99 @@ class VDBRetrievalMiddlewareUtils:
     def _retrieve_chroma_db_with_user_message(
         self, state: AgentState
     ) -> Sequence[Document] | None:
-        """Retrieve relevant conversations from ChromaDB based on the user's latest message.
+        """Retrieve conversations from ChromaDB relevant to the latest user message.
 
-        This method extracts the latest human message, searches ChromaDB for
-        similar conversations, and reranks the results to prioritize relevance.
+        This method extracts the latest human message and retrieves the
+        conversations relevant to it with _retrieve_chroma_db.
 
         Args:
             state (AgentState): The current agent state containing messages.
 
         Returns:
-            Sequence[Document] | None: A sequence of reranked Document objects
-                containing relevant past conversations, or None if no results found.
+            Sequence[Document] | None: A sequence of selected Document objects
+                containing relevant past conversations, ordered by selection,
+                or None if no results found.
         """
-        logger = logging.getLogger()
-
         human_message_type = MessageType.HUMAN
         message = get_latest_message_from_agent_state(state, human_message_type)
 
-        if not isinstance(message.content, str):
-            chroma_query = str(message.content)
-            self.logger.error(
-                "The retrieved message content is not a str, this might be unexpected behavior"
-            )
-        else:
-            chroma_query = message.content
+        return self._retrieve_chroma_db(ensure_message_content_is_str(message.content))
+
+    def _retrieve_chroma_db(self, chroma_query: str) -> Sequence[Document] | None:
+        """Retrieve conversations relevant to a query from ChromaDB.
+
+        This method searches ChromaDB for MMR_FETCH_K similar conversations,
+        drops those below MIN_RELEVANCE_SCORE as well as repeated texts and
+        selects MMR_TOP_K of the rest by maximal marginal relevance. The
+        embeddings are returned with the search hits, so the selection needs
+        no further model pass or query.
+
+        Args:
+            chroma_query (str): The search query, usually the user's message.
+
+        Returns:
+            Sequence[Document] | None: A sequence of selected Document objects
+                containing relevant past conversations, ordered by selection,
+                or None if no results found.
+        """
+        logger = logging.getLogger()
 
-        similar_conversations = self.chroma_manager.search_conversations(
-            chroma_query, n_results=20
+        hits = self.chroma_manager.search_conversation_hits(
+            chroma_query, n_results=MMR_FETCH_K
         )
 
-        if not similar_conversations:
+        if not hits.ids:
             logger.error("No documents could be retrieved from VDB")
             return None
 
-        docs_to_rerank = [
+        query_similarities = 1 - np.asarray(hits.distances, dtype=np.float32)
+        # Hits are ordered by distance, so the relevant ones form a prefix.
+        relevant = int(np.count_nonzero(query_similarities >= MIN_RELEVANCE_SCORE))
+        if relevant == 0:
+            logger.info("No VDB documents reached the minimum relevance score")
+            return None
+
+        # Repeated turns have identical texts, so only the closest copy of
+        # each text is kept as a candidate.
+        first_index_of_content: dict[str, int] = {}
+        for i in range(relevant):
+            first_index_of_content.setdefault(hits.contents[i], i)
+        candidates = list(first_index_of_content.values())
+
+        if len(candidates) <= MMR_TOP_K:
+            # All candidates are selected anyway and are already ordered.
+            selection = candidates
+        else:
+            selection = [
+                candidates[i]
+                for i in _maximal_marginal_relevance(
+                    query_similarities[candidates], hits.embeddings[candidates]
+                )
+            ]
+
+        selected_docs = [
             Document(
-                page_content=conversation["content"], metadata=conversation["metadata"]
+                page_content=hits.contents[i],
+                metadata={
+                    **hits.metadatas[i],
+                    "relevance_score": float(query_similarities[i]),
+                },
             )
-            for conversation in similar_conversations
+            for i in selection
         ]
-
-        reranked_docs = self.reranker.compress_documents(docs_to_rerank, chroma_query)
-        return reranked_docs
+        return selected_docs
 
     def _build_vdb_augmentation_context_message(
-        self, reranked_docs: Sequence[Document]
+        self, documents: Sequence[Document]
     ) -> str | None:
-        """Build a context message from reranked conversation documents.
+        """Build a context message from selected conversation documents.
 
-        This method formats the top 3 most relevant past conversations into
+        This method formats the selected past conversations into
         a structured context message that can be injected into the AI's
         conversation to provide relevant background information.
 
         Args:
-            reranked_docs (Sequence[Document]): A sequence of reranked Document
+            documents (Sequence[Document]): A sequence of selected Document
                 objects containing relevant past conversations.
 
         Returns:
@@ -98,18 +195,18 @@ class VDBRetrievalMiddlewareUtils:
                 conversations with timestamps and usage instructions, or None
                 if no documents are available.
         """
-        augmentation_context = ""
-
-        if not reranked_docs:
-            self.logger.error("No documents returned from reranker")
+        if not documents:
+            self.logger.error("No documents selected from VDB results")
             return None
 
-        augmentation_context += "\n--- Similar Past Conversations ---\n"
-        for i, doc in enumerate(reranked_docs, 1):
-            if i <= 3:
-                timestamp = doc.metadata.get("timestamp", "unknown")
-                augmentation_context += f"\n[Conversation {i}], date: {timestamp}):\n"
-                augmentation_context += f"{doc.page_content}\n"
+        # Collect the parts and join them once instead of growing a string.
+        context_parts = [CONVERSATIONS_CONTEXT_HEADER]
+        for i, doc in enumerate(documents, 1):
+            timestamp = doc.metadata.get("timestamp", "unknown")
+            context_parts.append(
+                f"\n[Conversation {i}], date: {timestamp}):\n{doc.page_content}\n"
+            )
+        augmentation_context = "".join(context_parts)
 
         retrieval_context = f"""
             <retrieved_context>
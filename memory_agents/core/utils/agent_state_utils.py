@@ -1,5 +1,7 @@
 from enum import Enum
+from typing import cast
 from langchain.agents.middleware import AgentState
+from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.messages.utils import AnyMessage
 
 
@@ -8,30 +10,84 @@ class MessageType(Enum):
     AI = "ai"
 
 
+def get_latest_message_index_from_agent_state(
+    state: AgentState, type: MessageType, start_index: int = 0
+) -> int:
+    """Gets the index of the latest message of a specific type in the agent state.
+
+    Messages are scanned backwards from the tail, where LangGraph appends new
+    messages, and the scan stops at start_index.
+
+    Args:
+        state: The agent state containing messages.
+        type: The message type to retrieve (human or assistant).
+        start_index: Index of the first message to consider. Messages before
+            it are not scanned.
+
+    Returns:
+        The index of the latest message of the specified type.
+
+    Raises:
+        ValueError: If no message of the given type is found.
+    """
+    messages: list[AnyMessage] = state["messages"]
+    type_value = type.value
+
+    for index in range(len(messages) - 1, max(start_index, 0) - 1, -1):
+        if getattr(messages[index], "type", None) == type_value:
+            return index
+
+    raise ValueError("Message could not be found according to given type")
+
+
 def get_latest_message_from_agent_state(
-    state: AgentState, type: MessageType
+    state: AgentState, type: MessageType, start_index: int = 0
 ) -> AnyMessage:
     """Gets the latest message of a specific type from the agent state.
 
     Args:
         state: The agent state containing messages.
         type: The message type to retrieve (human or assistant).
+        start_index: Index of the first message to consider. Messages before
+            it are not scanned.
 
     Returns:
-        The latest message of the specified type, or None if not found.
+        The latest message of the specified type.
+
+    Raises:
+        ValueError: If no message of the given type is found.
     """
-    messages: list[AnyMessage] = state["messages"]
+    index = get_latest_message_index_from_agent_state(state, type, start_index)
+    return state["messages"][index]
+
 
-    output_message = None
-    for message in reversed(messages):
-        if hasattr(message, "type") and message.type == type.value:
-            output_message = message
-            break
+def get_latest_conversation_turn_from_agent_state(
+    state: AgentState,
+) -> tuple[HumanMessage, AIMessage]:
+    """Gets the latest user message and the AI response that follows it.
 
-    if not output_message:
-        raise ValueError("Message could not be found according to given type")
+    Messages are matched by their type field, which only HumanMessage and
+    AIMessage (including their chunk subclasses) set to "human" and "ai", so
+    the returned messages need no further isinstance checks.
 
-    return output_message
+    Args:
+        state: The agent state containing messages.
+
+    Returns:
+        A tuple containing the latest human message and the latest AI message
+        after it.
+
+    Raises:
+        ValueError: If no human message, or no AI message after it, is found.
+    """
+    user_index = get_latest_message_index_from_agent_state(state, MessageType.HUMAN)
+    ai_message = get_latest_message_from_agent_state(
+        state, MessageType.AI, user_index + 1
+    )
+    return (
+        cast(HumanMessage, state["messages"][user_index]),
+        cast(AIMessage, ai_message),
+    )
 
 
 def insert_thread_id_in_state(state: AgentState, thread_id: str):
@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import InMemorySaver
+
+from memory_agents.core.config import CHECKPOINTER_MAX_THREADS
+
+
+class BoundedInMemorySaver(InMemorySaver):
+    """In-memory checkpointer that keeps at most a fixed number of threads.
+
+    LangGraph's InMemorySaver keeps every checkpoint of every thread for the
+    lifetime of the process, so a long-running agent grows without bound. This
+    subclass tracks threads in least-recently-used order and deletes the
+    checkpoints of the oldest thread once more than max_threads are stored.
+    Writes and evictions happen under one lock, so a thread that is written
+    concurrently is never deleted after it was marked as recently used.
+
+    Attributes:
+        max_threads (int): Maximum number of threads kept in memory.
+    """
+
+    def __init__(self, max_threads: int = CHECKPOINTER_MAX_THREADS) -> None:
+        """Initialize the bounded checkpointer.
+
+        Args:
+            max_threads: Maximum number of threads kept in memory. Defaults to
+                CHECKPOINTER_MAX_THREADS from config.
+        """
+        super().__init__()
+        self.max_threads = max_threads
+        self._thread_ids: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """Get a checkpoint tuple and mark its thread as recently used.
+
+        Reading a thread without checkpoints does not track it, so lookups of
+        unknown threads cannot evict stored ones.
+
+        Args:
+            config: The config to use for retrieving the checkpoint.
+
+        Returns:
+            The retrieved checkpoint tuple, or None if no matching checkpoint was found.
+        """
+        thread_id = config["configurable"]["thread_id"]
+        with self._lock:
+            if thread_id in self.storage:
+                self._touch_thread(thread_id)
+        return super().get_tuple(config)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint and mark its thread as recently used.
+
+        Args:
+            config: The config to associate with the checkpoint.
+            checkpoint: The checkpoint to save.
+            metadata: Additional metadata to save with the checkpoint.
+            new_versions: New versions as of this write.
+
+        Returns:
+            The updated config containing the saved checkpoint's timestamp.
+        """
+        with self._lock:
+            self._touch_thread(config["configurable"]["thread_id"])
+            return super().put(config, checkpoint, metadata, new_versions)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes associated with a thread ID.
+
+        Args:
+            thread_id: The thread ID to delete.
+        """
+        with self._lock:
+            self._thread_ids.pop(thread_id, None)
+            super().delete_thread(thread_id)
+
+    def _touch_thread(self, thread_id: Any) -> None:
+        """Move a thread to the most recently used position and evict overflow.
+
+        Must be called while holding the lock.
+
+        Args:
+            thread_id: The thread ID that was just read or written.
+        """
+        self._thread_ids[thread_id] = None
+        self._thread_ids.move_to_end(thread_id)
+        while len(self._thread_ids) > self.max_threads:
+            evicted_thread_id, _ = self._thread_ids.popitem(last=False)
+            super().delete_thread(evicted_thread_id)
@@ -0,0 +1,50 @@
+import asyncio
+import logging
+import time
+
+from memory_agents.core.config import GRAPHITI_INGESTION_SECONDS
+
+_ingested_at: dict[str, float] = {}
+
+logger = logging.getLogger()
+
+
+def mark_episodes_written(thread_id: str) -> None:
+    """Record that episodes of a conversation thread were sent to Graphiti.
+
+    Graphiti ingests episodes in the background, so they can only be
+    retrieved GRAPHITI_INGESTION_SECONDS after they were written.
+
+    Args:
+        thread_id: The conversation thread the episodes belong to.
+    """
+    _ingested_at[thread_id] = time.monotonic() + GRAPHITI_INGESTION_SECONDS
+
+
+def get_ingestion_time(thread_id: str) -> float:
+    """Return when the episodes last written for a thread are ingested.
+
+    Args:
+        thread_id: The conversation thread the episodes belong to.
+
+    Returns:
+        The time.monotonic() time at which the episodes are expected to be
+        ingested, or 0.0 if no episodes were written for the thread.
+    """
+    return _ingested_at.get(thread_id, 0.0)
+
+
+async def wait_for_episode_ingestion(thread_id: str) -> None:
+    """Wait until the episodes last written for a thread have been ingested.
+
+    Returns immediately if the ingestion time has already passed, e.g. while
+    the user was typing the next message, so the wait only delays retrieval
+    that follows a write closely.
+
+    Args:
+        thread_id: The conversation thread whose episodes are retrieved.
+    """
+    remaining = get_ingestion_time(thread_id) - time.monotonic()
+    if remaining > 0:
+        logger.debug("Waiting %.1fs for Graphiti to ingest episodes", remaining)
+        await asyncio.sleep(remaining)
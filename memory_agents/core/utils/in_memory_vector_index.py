@@ -0,0 +1,265 @@
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+from chromadb import QueryResult
+
+INT8_SCALE = 127
+"""int: Scale mapping unit-length vector components onto the int8 range."""
+
+SCORING_CHUNK_ROWS = 1024
+"""int: Rows of the int8 matrix widened to float32 at a time while scoring."""
+
+MetadataFilter = Dict[str, str | int | float | bool]
+"""Metadata filter matching documents whose metadata equals every key-value pair."""
+
+
+def validate_metadata_filter(where: MetadataFilter | None) -> None:
+    """Check that a metadata filter only consists of equality conditions.
+
+    ChromaDB's operator filters, such as {"$and": [...]} or
+    {"thread_id": {"$in": [...]}}, are not supported by the in-memory index.
+    They are rejected instead of silently matching no documents.
+
+    Args:
+        where: The metadata filter to check, or None.
+
+    Raises:
+        ValueError: If a key is an operator or a value is not a str, int,
+            float or bool.
+    """
+    for key, value in (where or {}).items():
+        if key.startswith("$") or not isinstance(value, (str, int, float, bool)):
+            raise ValueError(
+                f"Unsupported metadata filter {key!r}: {value!r}, only "
+                "equality conditions on str, int, float or bool values are supported"
+            )
+
+
+class InMemoryVectorIndex:
+    """Brute-force cosine similarity search over a contiguous in-memory matrix.
+
+    For the personal memory scale of the agents, a brute-force scan over an
+    (N, D) float32 matrix with numpy's BLAS-backed matrix product is faster
+    than a round trip through ChromaDB's HNSW index.
+
+    Vectors are L2-normalized and scalar-quantized to int8 on insert, which
+    takes a quarter of the memory of float32 and reduces the bandwidth of each
+    scan accordingly. Scores are computed as cosine similarities between the
+    quantized vectors, whose rounding error is far below the gap between
+    relevant and irrelevant conversations. The matrix grows geometrically, so
+    appending a conversation turn does not copy all previously stored vectors.
+
+    Attributes:
+        ids (list[str]): Document IDs, parallel to the rows of the matrix.
+        documents (list[str]): Document texts, parallel to the rows of the matrix.
+        metadatas (list[dict[str, Any]]): Document metadata, parallel to the rows
+            of the matrix.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._matrix: np.ndarray | None = None
+        self._inverse_norms: np.ndarray | None = None
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+
+    def __len__(self) -> int:
+        """Return the number of stored vectors."""
+        return len(self.ids)
+
+    def add(
+        self,
+        ids: List[str],
+        documents: List[str],
+        embeddings: Sequence[Sequence[float]],
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Append documents and their embeddings to the index.
+
+        Args:
+            ids: IDs of the documents.
+            documents: Texts of the documents.
+            embeddings: One embedding per document.
+            metadatas: One metadata dictionary per document.
+        """
+        if not ids:
+            return
+
+        vectors = self._quantize(np.asarray(embeddings, dtype=np.float32))
+        inverse_norms = self._inverse(
+            np.linalg.norm(vectors.astype(np.float32), axis=-1)
+        )
+        size = len(self.ids)
+        self._reserve(size + len(vectors), vectors.shape[-1])
+        self._matrix[size : size + len(vectors)] = vectors
+        self._inverse_norms[size : size + len(vectors)] = inverse_norms
+
+        self.ids.extend(ids)
+        self.documents.extend(documents)
+        self.metadatas.extend(metadatas)
+
+    def search(
+        self,
+        query_embedding: Sequence[float],
+        n_results: int,
+        where: MetadataFilter | None = None,
+    ) -> QueryResult:
+        """Find the documents most similar to the query embedding.
+
+        Args:
+            query_embedding: Embedding of the search query.
+            n_results: Maximum number of results to return.
+            where: Optional metadata filter. Only documents whose metadata
+                equals every given key-value pair are scored.
+
+        Returns:
+            A QueryResult for a single query, ordered by ascending cosine
+            distance, in the same layout as ChromaDB's collection.query. The
+            embeddings are the stored int8 vectors, which are proportional to
+            the normalized embeddings.
+
+        Raises:
+            ValueError: If the filter contains operators or non-scalar values.
+        """
+        validate_metadata_filter(where)
+        if len(self.ids) == 0 or n_results <= 0:
+            return self._query_result([], [])
+
+        matrix = self._matrix[: len(self.ids)]
+        inverse_norms = self._inverse_norms[: len(self.ids)]
+        rows = None
+        if where:
+            rows = np.flatnonzero(
+                [
+                    all(metadata.get(key) == value for key, value in where.items())
+                    for metadata in self.metadatas
+                ]
+            )
+            if len(rows) == 0:
+                return self._query_result([], [])
+            matrix, inverse_norms = matrix[rows], inverse_norms[rows]
+
+        query = self._quantize(np.asarray(query_embedding, dtype=np.float32))
+        query = query.astype(np.float32)
+
+        # numpy has no int8 dot product kernel, so the matrix is widened to
+        # float32 in small chunks that stay in cache and are scored with BLAS.
+        # Products of int8 values sum exactly in float32 for embedding sizes
+        # up to ~1000 dimensions.
+        dot_products = np.empty(len(matrix), dtype=np.float32)
+        for start in range(0, len(matrix), SCORING_CHUNK_ROWS):
+            chunk = matrix[start : start + SCORING_CHUNK_ROWS]
+            dot_products[start : start + len(chunk)] = chunk.astype(np.float32) @ query
+
+        # Dividing by the query norm does not change the ranking, so it is
+        # only applied to the selected rows. Scores are scaled in place to
+        # avoid allocating temporaries of the matrix length on every query.
+        scores = np.multiply(dot_products, inverse_norms, out=dot_products)
+        top_k = self._top_k(scores, n_results)
+        distances = 1.0 - scores[top_k] * self._inverse(np.linalg.norm(query))
+        if rows is not None:
+            top_k = rows[top_k]
+
+        return self._query_result(top_k.tolist(), distances.tolist())
+
+    def clear(self) -> None:
+        """Remove all documents from the index."""
+        self._matrix = None
+        self._inverse_norms = None
+        self.ids = []
+        self.documents = []
+        self.metadatas = []
+
+    def _reserve(self, size: int, dimension: int) -> None:
+        """Make sure the matrix has room for at least size vectors.
+
+        Capacity is at least doubled on growth, so a sequence of appends
+        copies every stored vector only a constant number of times.
+
+        Args:
+            size: Number of vectors the matrix must be able to hold.
+            dimension: Dimension of the stored vectors.
+        """
+        capacity = 0 if self._matrix is None else len(self._matrix)
+        if size <= capacity:
+            return
+
+        capacity = max(size, 2 * capacity)
+        matrix = np.empty((capacity, dimension), dtype=np.int8)
+        inverse_norms = np.empty(capacity, dtype=np.float32)
+        if self._matrix is not None:
+            matrix[: len(self.ids)] = self._matrix[: len(self.ids)]
+            inverse_norms[: len(self.ids)] = self._inverse_norms[: len(self.ids)]
+        self._matrix, self._inverse_norms = matrix, inverse_norms
+
+    def _query_result(self, indices: List[int], distances: List[float]) -> QueryResult:
+        """Build a single-query QueryResult for the given rows.
+
+        Args:
+            indices: Row indices of the matched documents.
+            distances: Cosine distances of the matched documents.
+
+        Returns:
+            The matched documents in ChromaDB's QueryResult layout.
+        """
+        embeddings = self._matrix[indices] if indices else np.empty((0, 0), np.int8)
+        return {
+            "ids": [[self.ids[i] for i in indices]],
+            "documents": [[self.documents[i] for i in indices]],
+            "metadatas": [[self.metadatas[i] for i in indices]],
+            "distances": [distances],
+            "embeddings": [embeddings],
+            "uris": None,
+            "data": None,
+            "included": ["documents", "metadatas", "distances", "embeddings"],
+        }
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Select the indices of the k highest scores.
+
+        Uses a linear-time partial sort and only fully sorts the selected
+        indices, unless all scores are selected anyway.
+
+        Args:
+            scores: Similarity scores of all stored vectors.
+            k: Number of indices to select.
+
+        Returns:
+            Indices of the k highest scores, ordered by descending score.
+        """
+        if k >= len(scores):
+            return np.argsort(scores)[::-1]
+
+        top_k = np.argpartition(scores, len(scores) - k)[len(scores) - k :]
+        return top_k[np.argsort(scores[top_k])[::-1]]
+
+    @staticmethod
+    def _inverse(norms: np.ndarray) -> np.ndarray:
+        """Invert vector norms, mapping zero norms to zero.
+
+        Args:
+            norms: Norms of one or more vectors.
+
+        Returns:
+            1 / norms as float32, with 0 wherever a norm is 0.
+        """
+        norms = np.asarray(norms, dtype=np.float32)
+        return np.divide(1.0, norms, out=np.zeros_like(norms), where=norms != 0)
+
+    @staticmethod
+    def _quantize(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalize vectors and quantize them to int8.
+
+        Args:
+            vectors: A single vector or a matrix of row vectors.
+
+        Returns:
+            The normalized vectors scaled by INT8_SCALE and rounded to int8.
+            Zero vectors stay zero.
+        """
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        normalized = vectors / np.where(norms == 0, 1.0, norms)
+        quantized = np.clip(np.rint(normalized * INT8_SCALE), -INT8_SCALE, INT8_SCALE)
+        return quantized.astype(np.int8)
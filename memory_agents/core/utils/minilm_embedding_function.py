@@ -0,0 +1,77 @@
+from functools import cached_property
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+from chromadb.utils.embedding_functions import ONNXMiniLM_L6_V2
+
+MAX_SEQUENCE_LENGTH = 256
+"""int: Number of tokens after which a document is truncated before embedding."""
+
+
+class MiniLMEmbeddingFunction(ONNXMiniLM_L6_V2):
+    """all-MiniLM-L6-v2 ONNX embedding function with dynamic padding.
+
+    Chroma's ONNXMiniLM_L6_V2 pads every document to 256 tokens, so embedding
+    a ten-token query costs as much as embedding a full-length conversation
+    turn. This subclass pads each batch only to its longest document. Padding
+    tokens are masked out of the attention and the mean pooling, so the
+    embeddings match those of the parent class and vectors persisted with it
+    stay valid.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the embedding function on the CPU execution provider."""
+        super().__init__(preferred_providers=["CPUExecutionProvider"])
+
+    @cached_property
+    def tokenizer(self) -> Any:
+        """Load the tokenizer, padding each batch to its longest document.
+
+        Returns:
+            The tokenizer of the model.
+        """
+        tokenizer = self.Tokenizer.from_file(
+            str(self.DOWNLOAD_PATH / self.EXTRACTED_FOLDER_NAME / "tokenizer.json")
+        )
+        tokenizer.enable_truncation(max_length=MAX_SEQUENCE_LENGTH)
+        tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+        return tokenizer
+
+    def _forward(
+        self, documents: list[str], batch_size: int = 32
+    ) -> npt.NDArray[np.float32]:
+        """Embed documents in batches padded to their longest document.
+
+        Args:
+            documents: The documents to embed.
+            batch_size: Number of documents embedded per model run.
+
+        Returns:
+            The L2-normalized embeddings of the documents as rows.
+        """
+        all_embeddings = []
+        for i in range(0, len(documents), batch_size):
+            encoded = self.tokenizer.encode_batch(documents[i : i + batch_size])
+            input_ids = np.array([e.ids for e in encoded], dtype=np.int64)
+            attention_mask = np.array(
+                [e.attention_mask for e in encoded], dtype=np.int64
+            )
+
+            last_hidden_state = self.model.run(
+                None,
+                {
+                    "input_ids": input_ids,
+                    "attention_mask": attention_mask,
+                    "token_type_ids": np.zeros_like(input_ids),
+                },
+            )[0]
+
+            # Mean pooling over the tokens that are not padding.
+            mask = attention_mask[:, :, np.newaxis].astype(np.float32)
+            embeddings = np.sum(last_hidden_state * mask, 1) / np.clip(
+                mask.sum(1), a_min=1e-9, a_max=None
+            )
+            all_embeddings.append(self._normalize(embeddings).astype(np.float32))
+
+        return np.concatenate(all_embeddings)
@@ -0,0 +1,83 @@
+import logging
+import re
+
+from langchain.agents.middleware import AgentState
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from memory_agents.core.utils.message_conversion_utils import (
+    ensure_message_content_is_str,
+)
+
+ACKNOWLEDGEMENT_WORDS = frozenset(
+    {
+        "bye",
+        "cool",
+        "continue",
+        "go",
+        "great",
+        "hi",
+        "hello",
+        "hey",
+        "k",
+        "nice",
+        "no",
+        "nope",
+        "ok",
+        "okay",
+        "on",
+        "please",
+        "sure",
+        "thank",
+        "thanks",
+        "thx",
+        "you",
+        "yes",
+        "yep",
+        "yeah",
+    }
+)
+"""frozenset[str]: Words of conversational filler that never needs memory retrieval.
+
+Messages consisting only of these words, like "ok", "thanks" or "go on", are
+answered from the conversation itself, so retrieving memories for them only
+adds latency.
+"""
+
+_WORD_PATTERN = re.compile(r"[a-z']+")
+
+logger = logging.getLogger()
+
+
+def should_retrieve(state: AgentState) -> bool:
+    """Decide whether memories should be retrieved before the next model call.
+
+    Retrieval is skipped if the latest message is not a user message, e.g.
+    when the model is called again after a tool call, or if the user message
+    only consists of acknowledgement words. System messages with context
+    injected by other retrieval middlewares are ignored.
+
+    Args:
+        state (AgentState): The current agent state containing messages.
+
+    Returns:
+        bool: True if memories should be retrieved, False otherwise.
+    """
+    latest_message = next(
+        (
+            message
+            for message in reversed(state["messages"])
+            if not isinstance(message, SystemMessage)
+        ),
+        None,
+    )
+    if not isinstance(latest_message, HumanMessage):
+        logger.debug("Skipping retrieval, the latest message is not a user message")
+        return False
+
+    content = ensure_message_content_is_str(latest_message.content)
+    words = _WORD_PATTERN.findall(content.lower())
+    if words and ACKNOWLEDGEMENT_WORDS.issuperset(words):
+        logger.debug("Skipping retrieval for acknowledgement %r", content)
+        return False
+
+    return True
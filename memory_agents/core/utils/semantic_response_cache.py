@@ -0,0 +1,150 @@
+import threading
+import time
+from itertools import count
+from typing import Callable, List, Sequence
+
+import numpy as np
+
+from memory_agents.core.config import (
+    RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+class SemanticResponseCache:
+    """Cache of model responses keyed by the embedding of the user query.
+
+    A query whose cosine similarity to a cached query of the same thread
+    reaches the similarity threshold is answered with the cached response, so
+    paraphrases of a recent question skip retrieval and the model call.
+    Normalized query embeddings are kept in a fixed-size float32 matrix. A
+    lookup selects the unexpired entries of the thread first and matches only
+    those with a single matrix-vector product. Entries expire after a time
+    to live, and the least recently used entry is replaced once the cache is
+    full.
+
+    Attributes:
+        embed_query: Function embedding a single query, shared with the
+            ChromaDB manager so no additional model is loaded and queries are
+            embedded once for both the cache and the conversation search.
+        similarity_threshold (float): Minimum cosine similarity of a hit.
+        max_size (int): Maximum number of cached responses.
+        ttl_seconds (float): Seconds after which a cached response expires.
+    """
+
+    def __init__(
+        self,
+        embed_query: Callable[[str], Sequence[float]],
+        similarity_threshold: float = RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+        max_size: int = RESPONSE_CACHE_SIZE,
+        ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            embed_query: Function embedding a single query.
+            similarity_threshold: Minimum cosine similarity of a hit. Defaults
+                to RESPONSE_CACHE_SIMILARITY_THRESHOLD from config.
+            max_size: Maximum number of cached responses. Defaults to
+                RESPONSE_CACHE_SIZE from config.
+            ttl_seconds: Seconds after which a cached response expires.
+                Defaults to RESPONSE_CACHE_TTL_SECONDS from config.
+        """
+        self.embed_query = embed_query
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired ones."""
+        return self._size
+
+    def lookup(self, query: str, thread_id: str) -> str | None:
+        """Return the cached response to a query similar to the given one.
+
+        Args:
+            query: The user query.
+            thread_id: The conversation thread the query belongs to.
+
+        Returns:
+            The response of the most similar cached query of the thread, or
+            None if no unexpired cached query reaches the similarity threshold.
+        """
+        embedding = self._embed(query)
+        with self._lock:
+            if self._size == 0:
+                return None
+
+            # Only unexpired entries of the thread can match, so they are
+            # selected first and compared with the query on their own.
+            candidates = np.flatnonzero(
+                (self._thread_ids[: self._size] == thread_id)
+                & (self._created_at[: self._size] > time.monotonic() - self.ttl_seconds)
+            )
+            if len(candidates) == 0:
+                return None
+
+            similarities = self._embeddings[candidates] @ embedding
+            best_candidate = int(np.argmax(similarities))
+            if similarities[best_candidate] < self.similarity_threshold:
+                return None
+
+            best = int(candidates[best_candidate])
+            self._last_used[best] = next(self._clock)
+            return self._responses[best]
+
+    def add(self, query: str, response: str, thread_id: str) -> None:
+        """Cache the response to a query.
+
+        Args:
+            query: The user query.
+            response: The response of the model to the query.
+            thread_id: The conversation thread the query belongs to.
+        """
+        embedding = self._embed(query)
+        with self._lock:
+            if self._size < self.max_size:
+                slot = self._size
+                self._size += 1
+                self._responses.append(response)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._responses[slot] = response
+
+            if self._embeddings is None:
+                self._embeddings = np.empty(
+                    (self.max_size, len(embedding)), dtype=np.float32
+                )
+            self._embeddings[slot] = embedding
+            self._thread_ids[slot] = thread_id
+            self._created_at[slot] = time.monotonic()
+            self._last_used[slot] = next(self._clock)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._size = 0
+            self._embeddings: np.ndarray | None = None
+            self._responses: List[str] = []
+            self._thread_ids = np.empty(self.max_size, dtype=object)
+            self._created_at = np.empty(self.max_size, dtype=np.float64)
+            self._last_used = np.empty(self.max_size, dtype=np.int64)
+            self._clock = count()
+
+    def _embed(self, query: str) -> np.ndarray:
+        """Embed and L2-normalize a query.
+
+        Args:
+            query: The text to embed.
+
+        Returns:
+            The normalized float32 embedding of the query.
+        """
+        embedding = np.asarray(self.embed_query(query), dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if norm != 0:
+            embedding = embedding / norm
+        return embedding
@@ -1,18 +1,44 @@
 import asyncio
 import threading
+from concurrent.futures import Future
 from typing import Coroutine
 
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use.
+
+    All runners schedule their coroutines on the same loop, so a process
+    runs a single background thread no matter how many middlewares it creates.
+
+    Returns:
+        The shared event loop, running in a daemon thread.
+    """
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_run_loop, args=(_background_loop,), daemon=True
+            ).start()
+        return _background_loop
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop):
+    """Run an asyncio event loop forever in the current thread.
+
+    Args:
+        loop: The event loop to run.
+    """
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
 
 class ThreadedSyncRunner:
     def __init__(self):
-        self.loop = asyncio.new_event_loop()
-        self.thread = threading.Thread(target=self._start_loop, daemon=True)
-        self.thread.start()
-
-    def _start_loop(self):
-        """Start the asyncio event loop in a separate thread."""
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
+        self.loop = _get_background_loop()
 
     def _run_async_task(self, task: Coroutine):
         """Run an async task in the separate event loop thread.
@@ -23,5 +49,18 @@ class ThreadedSyncRunner:
         Returns:
             The result of the coroutine execution.
         """
-        future = asyncio.run_coroutine_threadsafe(task, self.loop)
-        return future.result()
+        return self._submit_async_task(task).result()
+
+    def _submit_async_task(self, task: Coroutine) -> Future:
+        """Schedule an async task in the separate event loop thread.
+
+        Unlike _run_async_task this does not wait for the task, so the caller
+        can do other work while it runs.
+
+        Args:
+            task: The coroutine to run in the event loop.
+
+        Returns:
+            A future that resolves to the result of the coroutine execution.
+        """
+        return asyncio.run_coroutine_threadsafe(task, self.loop)
@@ -311,4 +311,9 @@ if __name__ == "__main__":
     if os.path.exists(args.subset_path):
         with open(args.subset_path, "r", encoding="utf-8") as f:
             subset = [line.strip() for line in f]
-    evaluate(difficulty, agent, no_generation=args.no_generation, subset=subset)
+    try:
+        evaluate(difficulty, agent, no_generation=args.no_generation, subset=subset)
+    finally:
+        # Agents with persistent memory store their buffered turns on close.
+        if hasattr(agent, "close"):
+            agent.close()
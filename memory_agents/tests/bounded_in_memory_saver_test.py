@@ -0,0 +1,80 @@
+"""Tests for the bounded in-memory checkpointer.
+
+This module contains tests to verify that the BoundedInMemorySaver keeps
+at most the configured number of conversation threads and evicts the least
+recently used thread once the limit is exceeded.
+
+The test verifies:
+- The least recently used thread is evicted when the limit is exceeded
+- Reading a thread marks it as recently used
+- Reading an unknown thread neither tracks it nor evicts a stored thread
+"""
+
+from langgraph.checkpoint.base import empty_checkpoint
+
+from memory_agents.core.utils.bounded_in_memory_saver import BoundedInMemorySaver
+
+
+def _put_checkpoint(saver: BoundedInMemorySaver, thread_id: str) -> None:
+    """Store an empty checkpoint for the given thread.
+
+    Args:
+        saver: The checkpointer to store the checkpoint in.
+        thread_id: The thread ID to associate the checkpoint with.
+    """
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    saver.put(config, empty_checkpoint(), {}, {})
+
+
+def _get_checkpoint(saver: BoundedInMemorySaver, thread_id: str):
+    """Read the latest checkpoint of the given thread.
+
+    Args:
+        saver: The checkpointer to read the checkpoint from.
+        thread_id: The thread ID of the checkpoint.
+
+    Returns:
+        The latest checkpoint tuple, or None if the thread is not stored.
+    """
+    return saver.get_tuple({"configurable": {"thread_id": thread_id}})
+
+
+def test_bounded_saver_evicts_least_recently_used_thread():
+    """Test eviction of the least recently used thread.
+
+    Stores checkpoints for more threads than the saver allows and verifies
+    that only the oldest thread is evicted, while a thread that was read
+    in between is kept.
+
+    Raises:
+        AssertionError: If the wrong thread is evicted or a checkpoint is missing.
+    """
+    saver = BoundedInMemorySaver(max_threads=2)
+
+    _put_checkpoint(saver, "thread_1")
+    _put_checkpoint(saver, "thread_2")
+    assert _get_checkpoint(saver, "thread_1") is not None
+
+    # thread_2 is now the least recently used thread and gets evicted.
+    _put_checkpoint(saver, "thread_3")
+
+    assert _get_checkpoint(saver, "thread_1") is not None
+    assert _get_checkpoint(saver, "thread_3") is not None
+    assert "thread_2" not in saver.storage
+    assert all(key[0] != "thread_2" for key in saver.blobs)
+
+
+def test_bounded_saver_ignores_reads_of_unknown_threads():
+    """Test that reading a thread without checkpoints evicts nothing.
+
+    Raises:
+        AssertionError: If an unknown thread is tracked or a stored thread
+            is evicted by reading it.
+    """
+    saver = BoundedInMemorySaver(max_threads=1)
+
+    _put_checkpoint(saver, "thread_1")
+    assert _get_checkpoint(saver, "unknown_thread") is None
+
+    assert _get_checkpoint(saver, "thread_1") is not None
+    assert list(saver._thread_ids) == ["thread_1"]
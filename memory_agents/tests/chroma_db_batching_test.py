@@ -0,0 +1,169 @@
+"""Tests for batched ChromaDB inserts.
+
+This module contains tests to verify that the ChromaDBManager buffers
+conversation turns until the configured batch size is reached and writes
+them to the collection in a single insert.
+
+The test verifies:
+- Turns below the batch size are buffered and not yet inserted
+- Reaching the batch size inserts all buffered turns
+- Searching flushes pending turns so they can be retrieved
+- Turns of a batch are timestamped with the time they were added
+- Turns added in the background can be retrieved once submitted
+- Closing the manager inserts the buffered turns
+- A closed manager can be garbage collected
+- Managers of the same directory allocate distinct turn IDs and see each
+  other's turns
+"""
+
+import gc
+import time
+import weakref
+from datetime import datetime
+
+from memory_agents.core.chroma_db_manager import ChromaDBManager
+
+
+def test_add_conversation_turn_inserts_in_batches(tmp_path):
+    """Test that conversation turns are inserted once the batch is full.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    Raises:
+        AssertionError: If turns are inserted before the batch is full or
+            pending turns are missing after a flush.
+    """
+    chroma_manager = ChromaDBManager(str(tmp_path / "test_chromadb"), batch_size=2)
+
+    chroma_manager.add_conversation_turn(
+        user_message="Hello, how are you?",
+        ai_message="I'm doing great, thanks for asking!",
+    )
+    assert chroma_manager.conversation_collection.count() == 0
+
+    chroma_manager.add_conversation_turn(
+        user_message="What's the weather like?",
+        ai_message="I'm sorry, I don't have access to real-time weather information.",
+    )
+    assert chroma_manager.conversation_collection.count() == 2
+
+    chroma_manager.add_conversation_turn(
+        user_message="Tell me a joke.",
+        ai_message="Why don't scientists trust atoms? Because they make up everything!",
+    )
+    assert chroma_manager.conversation_collection.count() == 2
+
+    results = chroma_manager.search_conversations("joke", n_results=3)
+    assert chroma_manager.conversation_collection.count() == 3
+    assert chroma_manager.count_conversation_turns() == 3
+    assert len(results) == 3
+
+
+def test_turns_keep_the_time_they_were_added(tmp_path):
+    """Test that the turns of one batch are not stamped with the flush time.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    Raises:
+        AssertionError: If the turns of a batch share one timestamp, or a
+            timestamp lies after the time its turn was added.
+    """
+    chroma_manager = ChromaDBManager(str(tmp_path / "test_chromadb"), batch_size=2)
+
+    chroma_manager.add_conversation_turn("Question 1", "Answer 1")
+    after_first = time.time()
+    time.sleep(0.01)
+    chroma_manager.add_conversation_turn("Question 2", "Answer 2")
+
+    stored = chroma_manager.conversation_collection.get(ids=["turn_1", "turn_2"])
+    timestamps = {
+        id: datetime.fromisoformat(metadata["timestamp"]).timestamp()
+        for id, metadata in zip(stored["ids"], stored["metadatas"])
+    }
+    assert timestamps["turn_1"] <= after_first
+    assert timestamps["turn_1"] < timestamps["turn_2"]
+
+
+def test_add_conversation_turn_in_background(tmp_path):
+    """Test that turns added in the background are visible to searches.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    Raises:
+        AssertionError: If a submitted turn is missing from the search results.
+    """
+    chroma_manager = ChromaDBManager(str(tmp_path / "test_chromadb"))
+
+    for i in range(3):
+        chroma_manager.add_conversation_turn_in_background(
+            user_message=f"Question {i}",
+            ai_message=f"Answer {i}",
+        )
+
+    results = chroma_manager.search_conversations("Question", n_results=5)
+    assert chroma_manager.count_conversation_turns() == 3
+    assert sorted(result["id"] for result in results) == [
+        "turn_1",
+        "turn_2",
+        "turn_3",
+    ]
+
+
+def test_close_inserts_pending_turns(tmp_path):
+    """Test that closing the manager inserts the buffered turns.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    Raises:
+        AssertionError: If buffered turns are missing after closing, or the
+            closed manager is still referenced.
+    """
+    chroma_manager = ChromaDBManager(str(tmp_path / "test_chromadb"), batch_size=100)
+
+    chroma_manager.add_conversation_turn_in_background(
+        user_message="Hello, how are you?",
+        ai_message="I'm doing great, thanks for asking!",
+    )
+    chroma_manager.close()
+
+    assert chroma_manager.conversation_collection.count() == 1
+
+    chroma_manager_ref = weakref.ref(chroma_manager)
+    del chroma_manager
+    gc.collect()
+    assert chroma_manager_ref() is None
+
+
+def test_managers_share_persist_directory(tmp_path):
+    """Test that managers of the same directory share their stored turns.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory path.
+
+    Raises:
+        AssertionError: If both managers allocate the same turn ID, or a
+            manager's search misses the turn stored by the other one.
+    """
+    persist_directory = str(tmp_path / "test_chromadb")
+    first_manager = ChromaDBManager(persist_directory)
+    second_manager = ChromaDBManager(persist_directory)
+
+    # Searching first caches a result that the other manager's turn must
+    # invalidate.
+    assert first_manager.search_conversations("Question", n_results=5) == []
+    first_manager.add_conversation_turn("Question 1", "Answer 1")
+    first_manager.search_conversations("Question", n_results=5)
+    second_manager.add_conversation_turn("Question 2", "Answer 2")
+
+    for chroma_manager in (first_manager, second_manager):
+        results = chroma_manager.search_conversations("Question", n_results=5)
+        assert sorted(result["id"] for result in results) == ["turn_1", "turn_2"]
+        assert chroma_manager.count_conversation_turns() == 2
+    assert first_manager.conversation_collection.count() == 2
+
+    first_manager.close()
+    second_manager.close()
@@ -0,0 +1,111 @@
+"""Tests for batched Graphiti writes.
+
+This module contains tests to verify that the GraphitiAugmentationMiddleware
+buffers conversation turns until the configured batch size is reached and
+then writes one episode per turn to Graphiti.
+
+The test verifies:
+- Turns below the batch size are buffered and not yet written
+- Reaching the batch size writes all buffered turns, one episode each
+- Flushing writes the remaining buffered episodes
+- Every thread with an episode in a written batch is marked as written
+- Closing writes the buffered episodes and lets the middleware be collected
+"""
+
+import gc
+import weakref
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.tools import StructuredTool
+
+from memory_agents.core.middleware.graphiti_augmentation_middleware import (
+    GraphitiAugmentationMiddleware,
+)
+from memory_agents.core.utils.graphiti_ingestion import get_ingestion_time
+
+
+def test_graphiti_augmentation_writes_in_batches():
+    """Test that episodes are written once the batch is full.
+
+    Raises:
+        AssertionError: If episodes are written before the batch is full,
+            buffered episodes are missing after a flush, or a thread of a
+            written episode is not marked as written.
+    """
+    episodes = []
+
+    async def add_memory(name: str, episode_body: str) -> str:
+        """Record an episode instead of sending it to Graphiti."""
+        episodes.append((name, episode_body))
+        return "ok"
+
+    middleware = GraphitiAugmentationMiddleware(
+        {"add_memory": StructuredTool.from_function(coroutine=add_memory)},
+        batch_size=2,
+    )
+
+    assert not middleware._run_async_task(
+        middleware._graphiti_augmentation(
+            HumanMessage("Hello, how are you?"),
+            AIMessage("I'm doing great!"),
+            "batch-1",
+        )
+    )
+    assert episodes == []
+    assert get_ingestion_time("batch-1") == 0.0
+
+    assert middleware._run_async_task(
+        middleware._graphiti_augmentation(
+            HumanMessage("Tell me a joke."), AIMessage("Knock knock."), "batch-2"
+        )
+    )
+    assert get_ingestion_time("batch-1") > 0.0
+    assert get_ingestion_time("batch-2") > 0.0
+    assert [name for name, _ in episodes] == ["Conversation Turn"] * 2
+    assert episodes[0][1] == "User: Hello, how are you?\n\nAssistant: I'm doing great!"
+
+    middleware._run_async_task(
+        middleware._graphiti_augmentation(
+            HumanMessage("Goodbye."), AIMessage("See you!"), "batch-3"
+        )
+    )
+    assert get_ingestion_time("batch-3") == 0.0
+    middleware.flush()
+    assert get_ingestion_time("batch-3") > 0.0
+    assert episodes[-1] == (
+        "Conversation Turn",
+        "User: Goodbye.\n\nAssistant: See you!",
+    )
+    assert len(episodes) == 3
+
+
+def test_close_writes_pending_episodes():
+    """Test that closing the middleware writes buffered episodes.
+
+    Raises:
+        AssertionError: If buffered episodes are missing after closing, or
+            the closed middleware is still referenced.
+    """
+    episodes = []
+
+    async def add_memory(name: str, episode_body: str) -> str:
+        """Record an episode instead of sending it to Graphiti."""
+        episodes.append((name, episode_body))
+        return "ok"
+
+    middleware = GraphitiAugmentationMiddleware(
+        {"add_memory": StructuredTool.from_function(coroutine=add_memory)},
+        batch_size=100,
+    )
+    middleware._run_async_task(
+        middleware._graphiti_augmentation(
+            HumanMessage("Goodbye."), AIMessage("See you!"), "close-1"
+        )
+    )
+    middleware.close()
+    assert len(episodes) == 1
+
+    middleware_ref = weakref.ref(middleware)
+    del middleware
+    gc.collect()
+    assert middleware_ref() is None
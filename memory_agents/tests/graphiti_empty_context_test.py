@@ -0,0 +1,53 @@
+"""Tests for skipping empty Graphiti retrieval context.
+
+This module contains tests to verify that the Graphiti retrieval middleware
+only injects a system message when Graphiti found nodes or memory facts.
+
+The test verifies:
+- Empty search results do not add a system message to the state
+- Results with nodes or facts add the retrieval context
+"""
+
+import json
+
+from langchain_core.messages import HumanMessage
+
+from memory_agents.core.middleware.graphiti_retrieval_middleware import (
+    GraphitiRetrievalMiddleware,
+)
+
+
+def _text_block(payload):
+    """Wrap a Graphiti tool payload into a text content block list.
+
+    Args:
+        payload: The JSON payload returned by a Graphiti MCP tool.
+
+    Returns:
+        The payload as returned by the MCP tool adapter.
+    """
+    return [{"type": "text", "text": json.dumps(payload)}]
+
+
+def test_empty_graphiti_results_add_no_context():
+    """Test that only non-empty search results are injected as context.
+
+    Raises:
+        AssertionError: If an empty result adds a system message, or a
+            non-empty result does not.
+    """
+    middleware = GraphitiRetrievalMiddleware({})
+    empty_nodes = _text_block({"message": "No relevant nodes found", "nodes": []})
+    empty_facts = _text_block({"message": "No relevant facts found", "facts": []})
+    facts = _text_block({"message": "Facts retrieved", "facts": [{"fact": "x"}]})
+
+    state = {"messages": [HumanMessage(content="hi")]}
+    middleware._append_retrieval_context(state, (empty_nodes, empty_facts))
+    assert len(state["messages"]) == 1
+
+    middleware._append_retrieval_context(state, ("", None))
+    assert len(state["messages"]) == 1
+
+    middleware._append_retrieval_context(state, (empty_nodes, facts))
+    assert len(state["messages"]) == 2
+    assert "Retrieved memory facts" in state["messages"][-1].content
@@ -0,0 +1,52 @@
+"""Tests for waiting on Graphiti episode ingestion.
+
+This module contains tests to verify that Graphiti retrieval waits for
+recently written episodes to be ingested, instead of the write blocking the
+turn that stored them.
+
+The test verifies:
+- Retrieval right after a write waits for the remaining ingestion time
+- Retrieval of other threads and retrieval after the ingestion time do not wait
+"""
+
+import asyncio
+import time
+
+from memory_agents.core.utils import graphiti_ingestion
+from memory_agents.core.utils.graphiti_ingestion import (
+    mark_episodes_written,
+    wait_for_episode_ingestion,
+)
+
+
+def _timed_wait(thread_id):
+    """Wait for the ingestion of a thread and measure the duration.
+
+    Args:
+        thread_id: The conversation thread whose episodes are retrieved.
+
+    Returns:
+        The waited time in seconds.
+    """
+    start = time.monotonic()
+    asyncio.run(wait_for_episode_ingestion(thread_id))
+    return time.monotonic() - start
+
+
+def test_retrieval_waits_for_recent_writes(monkeypatch):
+    """Test that only retrieval following a write closely waits.
+
+    Args:
+        monkeypatch: Pytest fixture for patching the ingestion time.
+
+    Raises:
+        AssertionError: If retrieval waits without a recent write of the
+            thread, or does not wait after one.
+    """
+    monkeypatch.setattr(graphiti_ingestion, "GRAPHITI_INGESTION_SECONDS", 0.2)
+
+    mark_episodes_written("1")
+
+    assert _timed_wait("2") < 0.1
+    assert _timed_wait("1") >= 0.1
+    assert _timed_wait("1") < 0.1
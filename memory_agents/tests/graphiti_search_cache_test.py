@@ -0,0 +1,78 @@
+"""Tests for memoized Graphiti searches.
+
+This module contains tests to verify that the Graphiti retrieval middleware
+answers repeated queries of a thread from its search cache until episodes of
+the thread are written.
+
+The test verifies:
+- Repeating a query of the same thread does not search Graphiti again
+- Other queries and other threads are searched
+- Writing episodes for a thread invalidates its memoized results
+- Clearing the search cache discards all memoized results
+"""
+
+from langchain_core.tools import StructuredTool
+
+from memory_agents.core.middleware.graphiti_retrieval_middleware import (
+    GraphitiRetrievalMiddleware,
+)
+from memory_agents.core.utils import graphiti_ingestion
+from memory_agents.core.utils.graphiti_ingestion import mark_episodes_written
+
+
+def test_graphiti_searches_are_memoized_until_episodes_are_written(monkeypatch):
+    """Test that repeated queries hit the cache until the thread is written to.
+
+    Args:
+        monkeypatch: Pytest fixture for patching the ingestion time.
+
+    Raises:
+        AssertionError: If a repeated query searches Graphiti again, or a
+            query is answered from the cache after a write or a clear.
+    """
+    monkeypatch.setattr(graphiti_ingestion, "GRAPHITI_INGESTION_SECONDS", 0.0)
+    queries = []
+
+    async def search_nodes(query: str) -> str:
+        """Record a node search instead of sending it to Graphiti."""
+        queries.append(query)
+        return f"nodes for {query}"
+
+    async def search_memory_facts(query: str) -> str:
+        """Return facts without sending the search to Graphiti."""
+        return f"facts for {query}"
+
+    middleware = GraphitiRetrievalMiddleware(
+        {
+            "search_nodes": StructuredTool.from_function(coroutine=search_nodes),
+            "search_memory_facts": StructuredTool.from_function(
+                coroutine=search_memory_facts
+            ),
+        }
+    )
+
+    def retrieve(query, thread_id):
+        """Search Graphiti through the middleware."""
+        return middleware._run_async_task(
+            middleware._graphiti_retrieval(query, thread_id)
+        )
+
+    assert retrieve("my code", "cache-1") == (
+        "nodes for my code",
+        "facts for my code",
+    )
+    retrieve("my code", "cache-1")
+    assert queries == ["my code"]
+
+    retrieve("my cat", "cache-1")
+    retrieve("my code", "cache-2")
+    assert queries == ["my code", "my cat", "my code"]
+
+    mark_episodes_written("cache-1")
+    retrieve("my code", "cache-1")
+    assert queries == ["my code", "my cat", "my code", "my code"]
+
+    middleware.clear_search_cache()
+    retrieve("my cat", "cache-1")
+    assert queries[-1] == "my cat"
+    assert len(queries) == 5
@@ -0,0 +1,51 @@
+"""Tests for the in-memory vector index.
+
+This module contains tests to verify that the InMemoryVectorIndex returns
+the most similar documents ordered by cosine distance, in the same layout
+as a ChromaDB query result.
+
+The test verifies:
+- Results are ordered by ascending cosine distance
+- Distances of the int8-quantized vectors stay close to the exact ones
+- The number of results is capped by the number of stored documents
+- Metadata filters restrict the search to matching documents
+- Operator filters, which the index does not support, are rejected
+- Clearing the index removes all documents
+"""
+
+import pytest
+
+from memory_agents.core.utils.in_memory_vector_index import InMemoryVectorIndex
+
+
+def test_search_returns_nearest_documents_in_order():
+    """Test that search returns the nearest documents first.
+
+    Raises:
+        AssertionError: If the results are not ordered by cosine distance.
+    """
+    index = InMemoryVectorIndex()
+    index.add(
+        ids=["turn_1", "turn_2", "turn_3"],
+        documents=["east", "north", "north-east"],
+        embeddings=[[1.0, 0.0], [0.0, 2.0], [1.0, 1.0]],
+        metadatas=[{"turn_id": 1}, {"turn_id": 2}, {"turn_id": 3}],
+    )
+
+    results = index.search([0.0, 1.0], n_results=5)
+
+    assert results["ids"][0] == ["turn_2", "turn_3", "turn_1"]
+    assert results["documents"][0] == ["north", "north-east", "east"]
+    assert results["distances"][0] == pytest.approx([0.0, 1 - 2**-0.5, 1.0], abs=1e-3)
+
+    results = index.search([0.0, 1.0], n_results=5, where={"turn_id": 1})
+    assert results["ids"][0] == ["turn_1"]
+
+    with pytest.raises(ValueError):
+        index.search([0.0, 1.0], n_results=5, where={"$and": [{"turn_id": 1}]})
+    with pytest.raises(ValueError):
+        index.search([0.0, 1.0], n_results=5, where={"turn_id": {"$in": [1, 2]}})
+
+    index.clear()
+    assert len(index) == 0
+    assert index.search([0.0, 1.0], n_results=5)["ids"][0] == []
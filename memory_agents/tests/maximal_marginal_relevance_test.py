@@ -0,0 +1,83 @@
+"""Tests for the maximal marginal relevance selection of VDB results.
+
+This module contains tests to verify that VDB retrieval selects conversations
+that are relevant to the query without repeating near-duplicates.
+
+The test verifies:
+- The most similar conversation is selected first
+- A near-duplicate of a selected conversation is selected after a diverse one
+- Conversations below the minimum relevance score are not selected
+- Repeated conversations are selected once
+"""
+
+import numpy as np
+
+from memory_agents.core.chroma_db_manager import SearchHits
+from memory_agents.core.middleware.vdb_retrieval_middlware_utils import (
+    VDBRetrievalMiddlewareUtils,
+    _maximal_marginal_relevance,
+)
+
+
+def test_maximal_marginal_relevance_prefers_diverse_results():
+    """Test that near-duplicates are ranked below diverse relevant results.
+
+    Raises:
+        AssertionError: If the selection order does not trade relevance
+            against diversity.
+    """
+    embeddings = np.array(
+        [[1.0, 0.0, 0.0], [0.99, 0.1, 0.0], [0.6, 0.0, 0.8]], dtype=np.float32
+    )
+    query_similarities = np.array([0.9, 0.89, 0.7], dtype=np.float32)
+
+    assert _maximal_marginal_relevance(query_similarities, embeddings, k=3) == [
+        0,
+        2,
+        1,
+    ]
+    assert _maximal_marginal_relevance(
+        query_similarities, embeddings, k=2, lambda_mult=1.0
+    ) == [0, 1]
+
+
+def test_irrelevant_and_repeated_conversations_are_not_selected():
+    """Test that irrelevant and repeated hits are dropped before selection.
+
+    Raises:
+        AssertionError: If an irrelevant conversation is selected, a
+            repeated conversation is selected twice, or retrieval returns
+            documents when no hit is relevant.
+    """
+
+    class _FakeChromaManager:
+        """Return fixed search hits instead of searching ChromaDB."""
+
+        def __init__(self, distances, contents=None):
+            """Store the distances and texts of the returned hits."""
+            self.distances = distances
+            self.contents = contents or [f"turn {i}" for i in range(len(distances))]
+
+        def search_conversation_hits(self, query, n_results):
+            """Return one hit per stored distance."""
+            return SearchHits(
+                ids=[str(i) for i in range(len(self.distances))],
+                contents=self.contents,
+                metadatas=[{} for _ in self.distances],
+                distances=self.distances,
+                embeddings=np.eye(len(self.distances), dtype=np.float32),
+            )
+
+    utils = VDBRetrievalMiddlewareUtils()
+    utils.chroma_manager = _FakeChromaManager([0.1, 0.3, 0.95, 0.99])
+    documents = utils._retrieve_chroma_db("query")
+    assert [document.page_content for document in documents] == ["turn 0", "turn 1"]
+
+    utils.chroma_manager = _FakeChromaManager([0.9, 0.95])
+    assert utils._retrieve_chroma_db("query") is None
+
+    utils.chroma_manager = _FakeChromaManager(
+        [0.1, 0.1, 0.2, 0.3], ["turn 0", "turn 0", "turn 1", "turn 0"]
+    )
+    documents = utils._retrieve_chroma_db("query")
+    assert [document.page_content for document in documents] == ["turn 0", "turn 1"]
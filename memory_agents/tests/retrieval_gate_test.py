@@ -0,0 +1,41 @@
+"""Tests for the retrieval gate.
+
+This module contains tests to verify that memory retrieval is skipped for
+messages that cannot benefit from it.
+
+The test verifies:
+- Questions are retrieved for, even when they are short
+- Acknowledgements are not retrieved for
+- Model calls that do not follow a user message are not retrieved for
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from memory_agents.core.utils.retrieval_gate import should_retrieve
+
+
+def test_should_retrieve_skips_acknowledgements_and_tool_results():
+    """Test that retrieval is only skipped for messages that do not need it.
+
+    Raises:
+        AssertionError: If retrieval is skipped for a question or performed
+            for an acknowledgement or tool result.
+    """
+    assert should_retrieve({"messages": [HumanMessage("Who am I?")]})
+    assert should_retrieve(
+        {"messages": [HumanMessage("Who am I?"), SystemMessage("<retrieved_context>")]}
+    )
+
+    assert not should_retrieve({"messages": [HumanMessage("ok")]})
+    assert not should_retrieve({"messages": [HumanMessage("Thank you!")]})
+    assert not should_retrieve({"messages": [HumanMessage("Yes, please go on.")]})
+
+    assert not should_retrieve(
+        {
+            "messages": [
+                HumanMessage("What is the weather?"),
+                AIMessage("", tool_calls=[{"name": "weather", "args": {}, "id": "1"}]),
+                ToolMessage("Sunny", tool_call_id="1"),
+            ]
+        }
+    )
@@ -0,0 +1,74 @@
+"""Tests for the semantic response cache.
+
+This module contains tests to verify that the SemanticResponseCache returns
+cached model responses for queries similar to a cached query of the same
+conversation thread.
+
+The test verifies:
+- Similar queries of the same thread return the cached response
+- Dissimilar queries and queries of other threads miss the cache
+- Expired responses are not returned
+- The least recently used response is replaced once the cache is full
+"""
+
+from memory_agents.core.utils.semantic_response_cache import SemanticResponseCache
+
+EMBEDDINGS = {
+    "What is my code?": [1.0, 0.0, 0.0],
+    "What's my code?": [0.99, 0.05, 0.0],
+    "Tell me a joke.": [0.0, 1.0, 0.0],
+    "How is the weather?": [0.0, 0.0, 1.0],
+}
+
+
+def _embed(query):
+    """Embed a query with a fixed embedding.
+
+    Args:
+        query: The query to embed.
+
+    Returns:
+        The embedding of the query.
+    """
+    return EMBEDDINGS[query]
+
+
+def test_lookup_returns_response_of_similar_query():
+    """Test that similar queries of the same thread hit the cache.
+
+    Raises:
+        AssertionError: If a similar query misses the cache or a dissimilar
+            query or a query of another thread hits it.
+    """
+    cache = SemanticResponseCache(_embed, similarity_threshold=0.95)
+    cache.add("What is my code?", "Your code is 42.", thread_id="1")
+
+    assert cache.lookup("What's my code?", thread_id="1") == "Your code is 42."
+    assert cache.lookup("Tell me a joke.", thread_id="1") is None
+    assert cache.lookup("What is my code?", thread_id="2") is None
+
+    cache.clear()
+    assert cache.lookup("What is my code?", thread_id="1") is None
+
+
+def test_expired_and_least_recently_used_responses_are_dropped():
+    """Test that expired responses miss and full caches evict the LRU entry.
+
+    Raises:
+        AssertionError: If an expired response is returned or the wrong
+            response is evicted.
+    """
+    expired_cache = SemanticResponseCache(_embed, ttl_seconds=-1)
+    expired_cache.add("What is my code?", "Your code is 42.", thread_id="1")
+    assert expired_cache.lookup("What is my code?", thread_id="1") is None
+
+    cache = SemanticResponseCache(_embed, max_size=2)
+    cache.add("What is my code?", "Your code is 42.", thread_id="1")
+    cache.add("Tell me a joke.", "Why did the chicken cross the road?", thread_id="1")
+    cache.lookup("What is my code?", thread_id="1")
+    cache.add("How is the weather?", "Sunny.", thread_id="1")
+
+    assert len(cache) == 2
+    assert cache.lookup("What is my code?", thread_id="1") == "Your code is 42."
+    assert cache.lookup("Tell me a joke.", thread_id="1") is None
+    assert cache.lookup("How is the weather?", thread_id="1") == "Sunny."
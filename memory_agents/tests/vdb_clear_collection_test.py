@@ -117,3 +117,5 @@ def test_clear_collection_resets_conversations(temp_chroma_dir):
     assert count_after_re_addition == 1, (
         f"Expected 1 conversation after re-addition, but got {count_after_re_addition}"
     )
+
+    agent.close()